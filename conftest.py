@@ -13,6 +13,37 @@ from unittest.mock import Mock, MagicMock
 # Add the src directory to the Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Headless SDL drivers: set before pygame is first imported so the display and
+# mixer open in-memory devices instead of probing X11/Wayland/audio hardware
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+@pytest.fixture(scope="session", autouse=True)
+def pygame_session():
+    """Initialize the real pygame once per session; under xdist, once per worker.
+    
+    This is the only place pygame.quit() runs, so tests and fixtures must not
+    tear pygame down themselves.
+    """
+    import pygame
+    
+    pygame.init()
+    yield pygame
+    pygame.quit()
+
+
+@pytest.fixture(autouse=True)
+def pygame_stays_initialized(pygame_session):
+    """Fail the test that shuts the real pygame down before the session ends."""
+    yield
+    if not pygame_session.get_init():
+        # Re-initialize so only the offending test is reported, not every later one
+        pygame_session.init()
+        pytest.fail("pygame.quit() ran mid-session; patch it with "
+                    "patch.object(pygame, 'quit') so only pygame_session tears pygame down")
+
+
 # Mock pygame for testing (since we don't want to initialize the display)
 @pytest.fixture(autouse=True)
 def mock_pygame():
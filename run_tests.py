@@ -64,6 +64,13 @@ def run_all_tests():
                       "Running all tests")
 
 
+def run_parallel_tests():
+    """Run all tests across CPU cores with pytest-xdist, one test file per worker."""
+    return run_command([sys.executable, "-m", "pytest", "tests/", "--tb=short",
+                       "-n", "auto", "--dist=loadfile"],
+                      "Running all tests in parallel")
+
+
 def run_tests_with_coverage():
     """Run tests with coverage reporting."""
     return run_command([sys.executable, "-m", "pytest", "tests/", "--cov=src", "--cov-report=term-missing", 
@@ -71,6 +78,13 @@ def run_tests_with_coverage():
                       "Running tests with coverage")
 
 
+def run_benchmarks():
+    """Run the performance benchmarks (requires pytest-benchmark)."""
+    return run_command([sys.executable, "-m", "pytest", "tests/test_benchmarks.py",
+                       "--benchmark-only", "--benchmark-disable-gc", "--benchmark-warmup=on"],
+                      "Running benchmarks")
+
+
 def run_specific_test_file(test_file):
     """Run a specific test file."""
     if not os.path.exists(test_file):
@@ -129,6 +143,8 @@ def main():
     parser.add_argument("--quality", action="store_true", help="Run code quality checks")
     parser.add_argument("--install", action="store_true", help="Install dependencies")
     parser.add_argument("--file", type=str, help="Run a specific test file")
+    parser.add_argument("--benchmark", action="store_true", help="Run performance benchmarks")
+    parser.add_argument("--parallel", action="store_true", help="Run all tests in parallel (pytest-xdist)")
     parser.add_argument("--all", action="store_true", help="Run all tests and quality checks")
     
     args = parser.parse_args()
@@ -160,6 +176,12 @@ def main():
     elif args.file:
         if not run_specific_test_file(args.file):
             sys.exit(1)
+    elif args.benchmark:
+        if not run_benchmarks():
+            sys.exit(1)
+    elif args.parallel:
+        if not run_parallel_tests():
+            sys.exit(1)
     elif args.all:
         # Run everything
         if not install_dependencies():
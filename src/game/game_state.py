@@ -8,12 +8,17 @@ This module handles the overall game state, including:
 - Game configuration
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass
 from typing import Optional
 
 
-class GameStatus(Enum):
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class GameStatus(str, Enum):
     """Enumeration of possible game states."""
     MENU = "menu"
     PLAYING = "playing"
@@ -22,6 +27,10 @@ class GameStatus(Enum):
     SETTINGS = "settings"
 
 
+# States in which a game session is in progress
+_ACTIVE_STATES = frozenset({GameStatus.PLAYING, GameStatus.PAUSED})
+
+
 class Difficulty(Enum):
     """Enumeration of difficulty levels."""
     EASY = "easy"
@@ -29,15 +38,16 @@ class Difficulty(Enum):
     HARD = "hard"
 
 
-@dataclass
+@dataclass(eq=False, **_DATACLASS_SLOTS)
 class GameConfig:
     """Configuration settings for the game."""
-    grid_width: int = 30
-    grid_height: int = 20
-    cell_size: int = 20
+    # Speed fields are read every frame, so they come first
     initial_speed: float = 10.0  # cells per second
     speed_increase: float = 0.5   # speed increase per food eaten
     max_speed: float = 25.0       # maximum speed limit
+    grid_width: int = 30
+    grid_height: int = 20
+    cell_size: int = 20
 
 
 class GameState:
@@ -48,6 +58,9 @@ class GameState:
     configuration, and other global game variables.
     """
     
+    __slots__ = ('config', 'status', 'difficulty', 'score', 'high_score',
+                 'level', 'food_eaten', 'game_time')
+    
     def __init__(self, config: Optional[GameConfig] = None):
         """Initialize the game state with optional configuration."""
         self.config = config or GameConfig()
@@ -69,12 +82,12 @@ class GameState:
         
     def pause_game(self) -> None:
         """Pause the current game."""
-        if self.status == GameStatus.PLAYING:
+        if self.status is GameStatus.PLAYING:
             self.status = GameStatus.PAUSED
             
     def resume_game(self) -> None:
         """Resume a paused game."""
-        if self.status == GameStatus.PAUSED:
+        if self.status is GameStatus.PAUSED:
             self.status = GameStatus.PLAYING
             
     def end_game(self) -> None:
@@ -86,30 +99,32 @@ class GameState:
     def add_score(self, points: int) -> None:
         """Add points to the current score."""
         self.score += points
-        self.food_eaten += 1
+        food_eaten = self.food_eaten + 1
+        self.food_eaten = food_eaten
         
         # Level up every 5 food items
-        if self.food_eaten % 5 == 0:
+        if food_eaten % 5 == 0:
             self.level += 1
             
     def update_game_time(self, delta_time: float) -> None:
         """Update the game time counter."""
-        if self.status == GameStatus.PLAYING:
+        if self.status is GameStatus.PLAYING:
             self.game_time += delta_time
             
     def get_current_speed(self) -> float:
         """Calculate the current game speed based on level and food eaten."""
-        speed = self.config.initial_speed + (self.food_eaten * self.config.speed_increase)
-        return min(speed, self.config.max_speed)
+        config = self.config
+        return min(config.initial_speed + self.food_eaten * config.speed_increase,
+                   config.max_speed)
         
     def is_game_active(self) -> bool:
         """Check if the game is currently active (playing or paused)."""
-        return self.status in [GameStatus.PLAYING, GameStatus.PAUSED]
+        return self.status in _ACTIVE_STATES
         
     def can_pause(self) -> bool:
         """Check if the game can be paused."""
-        return self.status == GameStatus.PLAYING
+        return self.status is GameStatus.PLAYING
         
     def can_resume(self) -> bool:
         """Check if the game can be resumed."""
-        return self.status == GameStatus.PAUSED
+        return self.status is GameStatus.PAUSED
@@ -5,17 +5,39 @@ This module handles the game grid, coordinate system, and spatial relationships.
 It provides utilities for grid-based movement, boundary checking, and position calculations.
 """
 
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
+from math import hypot
 from typing import List, Tuple, Optional
 import random
 from enum import Enum
 
 
-@dataclass(frozen=True)
 class Position:
-    """Represents a 2D grid position."""
-    x: int
-    y: int
+    """
+    Represents an immutable 2D grid position.
+    
+    Written by hand with __slots__ instead of as a frozen dataclass: positions
+    are created for every snake step and neighbour lookup, and this keeps
+    instances small and construction cheap while still rejecting mutation.
+    """
+    
+    __slots__ = ('x', 'y')
+    
+    def __init__(self, x: int, y: int):
+        _set_x(self, x)
+        _set_y(self, y)
+    
+    def __setattr__(self, name: str, value: object) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+    
+    def __reduce__(self) -> Tuple[type, Tuple[int, int]]:
+        return (Position, (self.x, self.y))
+    
+    def __repr__(self) -> str:
+        return f"Position(x={self.x!r}, y={self.y!r})"
     
     def __add__(self, other: 'Position') -> 'Position':
         """Add two positions together."""
@@ -37,45 +59,62 @@ class Position:
     
     def distance_to(self, other: 'Position') -> float:
         """Calculate Euclidean distance to another position."""
-        return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
+        return hypot(other.x - self.x, other.y - self.y)
     
     def manhattan_distance_to(self, other: 'Position') -> int:
         """Calculate Manhattan distance to another position."""
         return abs(self.x - other.x) + abs(self.y - other.y)
 
 
+# Slot setters used by Position.__init__, which otherwise refuses assignment
+_set_x = Position.x.__set__
+_set_y = Position.y.__set__
+
+# Shared unit-offset positions keyed by (dx, dy); Direction values are taken
+# from here so every step offset is the same object wherever it is used
+_DIR_POS_CACHE = {(dx, dy): Position(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)}
+
+
 class Direction(Enum):
     """Enumeration of movement directions."""
-    UP = Position(0, -1)
-    DOWN = Position(0, 1)
-    LEFT = Position(-1, 0)
-    RIGHT = Position(1, 0)
+    UP = _DIR_POS_CACHE[(0, -1)]
+    DOWN = _DIR_POS_CACHE[(0, 1)]
+    LEFT = _DIR_POS_CACHE[(-1, 0)]
+    RIGHT = _DIR_POS_CACHE[(1, 0)]
     
-    @classmethod
-    def get_opposite(cls, direction: 'Direction') -> 'Direction':
+    @staticmethod
+    def get_opposite(direction: 'Direction') -> 'Direction':
         """Get the opposite direction."""
-        opposites = {
-            cls.UP: cls.DOWN,
-            cls.DOWN: cls.UP,
-            cls.LEFT: cls.RIGHT,
-            cls.RIGHT: cls.LEFT
-        }
-        return opposites[direction]
-    
-    @classmethod
-    def from_string(cls, direction_str: str) -> Optional['Direction']:
+        return _OPPOSITES[direction]
+    
+    @staticmethod
+    def from_string(direction_str: str) -> Optional['Direction']:
         """Create a direction from a string representation."""
-        direction_map = {
-            'up': cls.UP,
-            'down': cls.DOWN,
-            'left': cls.LEFT,
-            'right': cls.RIGHT,
-            'w': cls.UP,
-            's': cls.DOWN,
-            'a': cls.LEFT,
-            'd': cls.RIGHT
-        }
-        return direction_map.get(direction_str.lower())
+        return _NAME_TO_DIRECTION.get(direction_str.lower()) if direction_str else None
+
+
+_OPPOSITES = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
+
+_NAME_TO_DIRECTION = {
+    'up': Direction.UP,
+    'down': Direction.DOWN,
+    'left': Direction.LEFT,
+    'right': Direction.RIGHT,
+    'w': Direction.UP,
+    's': Direction.DOWN,
+    'a': Direction.LEFT,
+    'd': Direction.RIGHT
+}
+
+# Neighbour offsets as (dx, dy): up, down, left, right, then the diagonals
+_CARDINAL_OFFSETS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_DIAGONAL_OFFSETS = ((-1, -1), (1, -1), (-1, 1), (1, 1))
+_ALL_OFFSETS = _CARDINAL_OFFSETS + _DIAGONAL_OFFSETS
 
 
 class Grid:
@@ -86,11 +125,26 @@ class Grid:
     for grid-based operations.
     """
     
-    def __init__(self, width: int, height: int):
-        """Initialize the grid with specified dimensions."""
+    def __init__(self, width: int, height: int, seed: Optional[int] = None):
+        """
+        Initialize the grid with specified dimensions.
+        
+        Args:
+            width: Number of columns
+            height: Number of rows
+            seed: Optional seed for this grid's random free-cell picks
+        """
         self.width = width
         self.height = height
-        self._occupied_positions: set[Position] = set()
+        # One byte per cell, indexed by y * width + x; 1 means occupied
+        self._cells = bytearray(width * height)
+        self._occupied_count = 0
+        # Unordered list of free cell indices and each cell's slot in it,
+        # kept in sync with swap-and-pop so random picks are O(1)
+        self._free_indices = list(range(width * height))
+        self._free_slot = list(range(width * height))
+        self._center = Position(width // 2, height // 2)
+        self._rng = random.Random(seed)
         
     def is_valid_position(self, position: Position) -> bool:
         """Check if a position is within the grid boundaries."""
@@ -102,90 +156,120 @@ class Grid:
     
     def is_position_occupied(self, position: Position) -> bool:
         """Check if a position is occupied by an object."""
-        return position in self._occupied_positions
+        return self._is_occupied_xy(position.x, position.y)
     
     def is_position_free(self, position: Position) -> bool:
         """Check if a position is free (not occupied)."""
-        return not self.is_position_occupied(position)
+        return not self._is_occupied_xy(position.x, position.y)
     
     def occupy_position(self, position: Position) -> bool:
-        """Mark a position as occupied. Returns False if already occupied."""
-        if self.is_position_occupied(position):
-            return False
-        self._occupied_positions.add(position)
-        return True
+        """
+        Mark a position as occupied.
+        
+        Returns False if the position is already occupied or off the grid.
+        """
+        return self._occupy_xy(position.x, position.y)
     
     def free_position(self, position: Position) -> bool:
         """Mark a position as free. Returns False if not occupied."""
-        if not self.is_position_occupied(position):
+        return self._free_xy(position.x, position.y)
+    
+    # Integer-coordinate fast paths behind the Position-based methods above.
+    # Game-loop code that already holds x/y can call these directly and skip
+    # building a Position.
+    
+    def _is_occupied_xy(self, x: int, y: int) -> bool:
+        """Check whether cell (x, y) is occupied; off-grid cells never are."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
             return False
-        self._occupied_positions.remove(position)
+        return self._cells[y * self.width + x] == 1
+    
+    def _occupy_xy(self, x: int, y: int) -> bool:
+        """Mark cell (x, y) as occupied. Returns False if taken or off-grid."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        index = y * self.width + x
+        if self._cells[index]:
+            return False
+        self._cells[index] = 1
+        self._occupied_count += 1
+        
+        # Move the last free index into this cell's slot and drop the tail
+        free_indices = self._free_indices
+        slot = self._free_slot[index]
+        last = free_indices.pop()
+        if last != index:
+            free_indices[slot] = last
+            self._free_slot[last] = slot
+        return True
+    
+    def _free_xy(self, x: int, y: int) -> bool:
+        """Mark cell (x, y) as free. Returns False if not occupied or off-grid."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        index = y * self.width + x
+        if not self._cells[index]:
+            return False
+        self._cells[index] = 0
+        self._occupied_count -= 1
+        self._free_slot[index] = len(self._free_indices)
+        self._free_indices.append(index)
         return True
     
     def get_random_free_position(self) -> Optional[Position]:
         """Get a random unoccupied position on the grid."""
-        free_positions = []
-        for x in range(self.width):
-            for y in range(self.height):
-                pos = Position(x, y)
-                if not self.is_position_occupied(pos):
-                    free_positions.append(pos)
-        
-        if not free_positions:
+        if not self._free_indices:
             return None
         
-        return random.choice(free_positions)
+        free_indices = self._free_indices
+        index = free_indices[self._rng.randrange(len(free_indices))]
+        return Position(index % self.width, index // self.width)
     
     def get_neighbors(self, position: Position, include_diagonals: bool = False) -> List[Position]:
         """Get valid neighboring positions."""
         neighbors = []
+        x, y = position.x, position.y
+        width, height = self.width, self.height
         
-        # Cardinal directions
-        directions = [
-            Direction.UP.value,
-            Direction.DOWN.value,
-            Direction.LEFT.value,
-            Direction.RIGHT.value
-        ]
-        
-        # Add diagonal directions if requested
-        if include_diagonals:
-            directions.extend([
-                Position(-1, -1),  # Top-left
-                Position(1, -1),   # Top-right
-                Position(-1, 1),   # Bottom-left
-                Position(1, 1)     # Bottom-right
-            ])
-        
-        for direction in directions:
-            neighbor = position + direction
-            if self.is_valid_position(neighbor):
-                neighbors.append(neighbor)
+        for dx, dy in (_ALL_OFFSETS if include_diagonals else _CARDINAL_OFFSETS):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                neighbors.append(Position(nx, ny))
         
         return neighbors
     
     def clear_all_occupied(self) -> None:
         """Clear all occupied positions."""
-        self._occupied_positions.clear()
+        if not self._occupied_count:
+            return  # Already empty; the free list is a valid permutation
+        
+        # Single memset-style slice writes instead of per-cell updates
+        cell_count = len(self._cells)
+        self._cells[:] = bytes(cell_count)
+        self._occupied_count = 0
+        self._free_indices[:] = range(cell_count)
+        self._free_slot[:] = range(cell_count)
     
     def get_occupied_count(self) -> int:
         """Get the number of occupied positions."""
-        return len(self._occupied_positions)
+        return self._occupied_count
     
     def get_free_count(self) -> int:
         """Get the number of free positions."""
-        return (self.width * self.height) - len(self._occupied_positions)
+        return (self.width * self.height) - self._occupied_count
     
     def is_grid_full(self) -> bool:
         """Check if the grid is completely full."""
-        return len(self._occupied_positions) >= (self.width * self.height)
+        return self._occupied_count >= (self.width * self.height)
     
     def get_grid_center(self) -> Position:
         """Get the center position of the grid."""
-        return Position(self.width // 2, self.height // 2)
+        return self._center
     
     def wrap_position(self, position: Position) -> Position:
         """Wrap a position around the grid boundaries (for wraparound mode)."""
-        x = position.x % self.width
-        y = position.y % self.height
-        return Position(x, y)
+        width, height = self.width, self.height
+        x, y = position.x, position.y
+        if 0 <= x < width and 0 <= y < height:
+            return position  # Positions are immutable, so in-bounds ones are reused
+        return Position(x % width, y % height)
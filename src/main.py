@@ -8,6 +8,7 @@ This is the entry point for the Snake game.
 import sys
 import pygame
 from src.game.game_logic import GameLogic, GameConfig
+from src.game.game_state import GameStatus
 from src.game.game_loop import FixedTimestepGameLoop
 from src.ui.display import DisplayManager
 from src.ui.game_renderer import GameRenderer
@@ -169,14 +170,12 @@ class SnakeGame:
         try:
             clock = pygame.time.Clock()
             while self.running:
-                # Handle events
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                        break
-                    
-                    # Handle input events
-                    self.game_controller.handle_event(event)
+                # Handle this frame's events as one batch
+                events = pygame.event.get()
+                if any(event.type == pygame.QUIT for event in events):
+                    self.running = False
+                else:
+                    self.game_controller.handle_events(events)
                 
                 # Get delta time for this frame
                 delta_time = clock.tick(60) / 1000.0  # Convert to seconds
@@ -211,7 +210,7 @@ class SnakeGame:
             game_status = self.game_controller.get_game_status()
             print(f"Game status: {game_status}")  # Debug output
             
-            if game_status == "game_over" or str(game_status) == "game_over":
+            if game_status is GameStatus.GAME_OVER:
                 print("Game over detected, switching to game over screen")  # Debug output
                 # Save high score if achieved
                 self.game_logic.get_scoring_system().save_high_score()
@@ -221,9 +220,9 @@ class SnakeGame:
                     self.audio_manager.play_background_music(BackgroundMusic.GAME_OVER)
                 self.current_screen = "game_over"
                 self.menu_manager.set_menu_state(MenuState.GAME_OVER)
-            elif game_status == "paused":
-                self.current_screen = "pause"
-                self.menu_manager.set_menu_state(MenuState.PAUSE_MENU)
+            elif game_status is GameStatus.PAUSED:
+                # Go through pause() so the paused flag and menu match the screen
+                self.pause()
     
     def physics_update(self, delta_time: float):
         """Update physics (called by game loop)."""
@@ -315,7 +314,7 @@ class SnakeGame:
         if self.current_screen == "game":
             self.game_controller.pause_game()
         elif self.current_screen == "pause":
-            self.game_controller.resume_game()
+            self.resume()
     
     def _handle_new_game(self):
         """Handle new game menu action."""
@@ -343,9 +342,7 @@ class SnakeGame:
     
     def _handle_resume(self):
         """Handle resume menu action."""
-        self.game_controller.resume_game()
-        self.current_screen = "game"
-        self.menu_manager.disable_menu()
+        self.resume()
     
     def _handle_restart(self):
         """Handle restart menu action."""
@@ -6,9 +6,13 @@ It uses Pygame as the graphics library for optimal game performance.
 """
 
 import pygame
+from collections import OrderedDict
 from typing import Tuple, Optional
 from ..game.game_state import GameConfig
 
+# Maximum number of rendered text surfaces DisplayManager keeps
+TEXT_CACHE_SIZE = 256
+
 
 class DisplayManager:
     """
@@ -58,6 +62,9 @@ class DisplayManager:
             'fuchsia': (255, 0, 255)
         }
         
+        # Rendered text surfaces keyed by (text, font, color); HUD labels repeat every frame
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        
         # Initialize Pygame
         self._initialize_pygame()
     
@@ -117,8 +124,10 @@ class DisplayManager:
         return self.colors
     
     def get_color(self, color_name: str) -> Tuple[int, int, int]:
-        """Get a specific color by name."""
-        return self.colors.get(color_name, self.colors['white'])
+        """Get a specific color by name, falling back to white."""
+        # Only look up the fallback on a miss; renderers call this many times per frame
+        color = self.colors.get(color_name)
+        return color if color is not None else self.colors['white']
     
     def get_window_size(self) -> Tuple[int, int]:
         """Get the window dimensions."""
@@ -168,7 +177,7 @@ class DisplayManager:
         if font is None:
             font = self.font
         
-        text_surface = font.render(text, True, self.get_color(color))
+        text_surface = self._render_text(text, font, self.get_color(color))
         
         if center:
             text_rect = text_surface.get_rect(center=position)
@@ -177,6 +186,22 @@ class DisplayManager:
         
         self.screen.blit(text_surface, text_rect)
     
+    def _render_text(self, text: str, font: pygame.font.Font,
+                     rgb: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text through a small LRU cache of surfaces."""
+        key = (text, font, rgb)
+        cache = self._text_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, rgb)
+        cache[key] = surface
+        if len(cache) > TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
+    
     def draw_rect(self, rect: pygame.Rect, color: str = 'white', 
                   fill: bool = True, border_width: int = 1) -> None:
         """
@@ -11,6 +11,15 @@ from ..game.grid import Direction
 from .input_manager import InputManager, InputAction, ControlScheme
 
 
+# Movement actions and the grid direction each one steers the snake in
+_ACTION_TO_DIRECTION = {
+    InputAction.MOVE_UP: Direction.UP,
+    InputAction.MOVE_DOWN: Direction.DOWN,
+    InputAction.MOVE_LEFT: Direction.LEFT,
+    InputAction.MOVE_RIGHT: Direction.RIGHT
+}
+
+
 class GameController:
     """
     Controls the game by integrating input handling with game logic.
@@ -152,13 +161,7 @@ class GameController:
     
     def _input_action_to_direction(self, action: InputAction) -> Optional[Direction]:
         """Convert input action to grid direction."""
-        direction_map = {
-            InputAction.MOVE_UP: Direction.UP,
-            InputAction.MOVE_DOWN: Direction.DOWN,
-            InputAction.MOVE_LEFT: Direction.LEFT,
-            InputAction.MOVE_RIGHT: Direction.RIGHT
-        }
-        return direction_map.get(action)
+        return _ACTION_TO_DIRECTION.get(action)
     
     def _is_movement_valid(self, direction: Direction) -> bool:
         """Check if a movement direction is valid for the snake."""
@@ -183,15 +186,8 @@ class GameController:
             current_direction = Direction.UP
         
         # Prevent 180° turns
-        if current_direction:
-            opposite_directions = {
-                Direction.UP: Direction.DOWN,
-                Direction.DOWN: Direction.UP,
-                Direction.LEFT: Direction.RIGHT,
-                Direction.RIGHT: Direction.LEFT
-            }
-            if direction == opposite_directions.get(current_direction):
-                return False
+        if current_direction and direction is Direction.get_opposite(current_direction):
+            return False
         
         return True
     
@@ -328,6 +324,11 @@ class GameController:
         if self.input_processing_enabled:
             self.input_manager.handle_event(event)
     
+    def handle_events(self, events):
+        """Handle a batch of pygame events in one call."""
+        if self.input_processing_enabled:
+            self.input_manager.handle_events(events)
+    
     def get_available_control_schemes(self):
         """Get all available control schemes."""
         return self.input_manager.get_available_control_schemes()
@@ -11,7 +11,7 @@ This module handles the rendering of all game elements:
 """
 
 import pygame
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from ..game.grid import Position
 from ..game.snake import Snake
 from ..game.food import Food, FoodType
@@ -70,6 +70,11 @@ class GameRenderer:
         self.hud_background_color = 'navy'
         self.hud_text_color = 'white'
         
+        # Grid lines are drawn once into this surface and redrawn only when
+        # the (grid size, cell size, line color) key they were built from changes
+        self._grid_surface: Optional[pygame.Surface] = None
+        self._grid_surface_key: Optional[tuple] = None
+        
         # Visual effects settings
         self.enable_particles = True
         self.enable_animations = True
@@ -163,18 +168,36 @@ class GameRenderer:
     
     def _render_grid(self) -> None:
         """Render the game grid background."""
-        grid_width, grid_height = self.display.get_grid_size()
-        
-        # Draw grid lines
-        for x in range(0, grid_width + 1, self.cell_size):
-            start_pos = (x, 0)
-            end_pos = (x, grid_height)
-            self.display.draw_line(start_pos, end_pos, self.grid_color, 1)
-        
-        for y in range(0, grid_height + 1, self.cell_size):
-            start_pos = (0, y)
-            end_pos = (grid_width, y)
-            self.display.draw_line(start_pos, end_pos, self.grid_color, 1)
+        key = (self.display.get_grid_size(), self.cell_size,
+               tuple(self.display.get_color(self.grid_color)))
+        if key != self._grid_surface_key:
+            self._grid_surface = self._build_grid_surface(*key)
+            self._grid_surface_key = key
+        self.display.screen.blit(self._grid_surface, (0, 0))
+    
+    def _build_grid_surface(self, grid_size: Tuple[int, int], cell_size: int,
+                            color: Tuple[int, int, int]) -> pygame.Surface:
+        """Draw the grid lines once onto an opaque, color-keyed surface."""
+        grid_width, grid_height = grid_size
+        
+        # Anything but the line color works as the transparent key
+        key_color = (0, 0, 0) if color != (0, 0, 0) else (255, 255, 255)
+        
+        # One pixel larger so the closing right and bottom lines are kept
+        surface = pygame.Surface((grid_width + 1, grid_height + 1))
+        surface.fill(key_color)
+        for x in range(0, grid_width + 1, cell_size):
+            pygame.draw.line(surface, color, (x, 0), (x, grid_height), 1)
+        
+        for y in range(0, grid_height + 1, cell_size):
+            pygame.draw.line(surface, color, (0, y), (grid_width, y), 1)
+        
+        # Match the screen's pixel format when a window exists; an RLE color key
+        # makes the per-frame blit skip the empty cells instead of alpha-blending them
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.set_colorkey(key_color, pygame.RLEACCEL)
+        return surface
     
     def _render_snake(self, snake: Snake) -> None:
         """Render the snake and its segments."""
@@ -6,7 +6,7 @@ Provides responsive and intuitive controls for the game.
 """
 
 import pygame
-from typing import Dict, List, Optional, Callable, Set
+from typing import Dict, Iterable, List, Optional, Callable, Set
 from enum import Enum
 from dataclasses import dataclass
 from collections import deque
@@ -197,6 +197,22 @@ class InputManager:
         elif event.type == pygame.KEYUP:
             self._handle_key_up(event.key)
     
+    def handle_events(self, events: Iterable[pygame.event.Event]):
+        """Handle a batch of pygame events, such as one frame's pygame.event.get()."""
+        keydown, keyup = pygame.KEYDOWN, pygame.KEYUP
+        handle_key_down = self._handle_key_down
+        handle_key_up = self._handle_key_up
+        
+        for event in events:
+            # Re-checked per event since a callback may disable input mid-batch
+            if not self.input_enabled:
+                return
+            event_type = event.type
+            if event_type == keydown:
+                handle_key_down(event.key)
+            elif event_type == keyup:
+                handle_key_up(event.key)
+    
     def _handle_key_down(self, key: int):
         """Handle a key press event."""
         if key not in self.keys_pressed:
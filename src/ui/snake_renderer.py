@@ -11,11 +11,15 @@ This module provides specialized rendering for the snake with:
 
 import pygame
 import math
-from typing import List, Tuple, Dict
+import numpy as np
+from typing import List, Tuple, Dict, Optional
 from ..game.grid import Position
 from ..game.snake import Snake
 from .display import DisplayManager
 
+# Snake length from which wave offsets are computed with NumPy instead of a loop
+WAVE_VECTORIZE_MIN_SEGMENTS = 40
+
 
 class SnakeRenderer:
     """
@@ -113,14 +117,17 @@ class SnakeRenderer:
         # Update growth animations
         self._update_growth_animations(delta_time)
         
+        # Wave offsets for every segment in one vectorized pass
+        wave_offsets = self._calculate_wave_offsets(len(body), self.movement_timer)
+        
         # Render each segment
         for i, segment in enumerate(body):
             if i == 0:
-                self._render_snake_head(segment, snake)
+                self._render_snake_head(segment, snake, wave_offsets[i])
             elif i == len(body) - 1:
-                self._render_snake_tail(segment, i)
+                self._render_snake_tail(segment, i, wave_offsets[i])
             else:
-                self._render_snake_body(segment, i, len(body))
+                self._render_snake_body(segment, i, len(body), wave_offsets[i])
     
     def _update_growth_animations(self, delta_time: float) -> None:
         """Update growth animations for all segments."""
@@ -145,14 +152,17 @@ class SnakeRenderer:
             'target_scale': 1.0
         }
     
-    def _render_snake_head(self, position: Position, snake: Snake) -> None:
+    def _render_snake_head(self, position: Position, snake: Snake,
+                           wave_offset: Optional[float] = None) -> None:
         """Render the snake's head with special effects."""
         colors = self.get_current_colors()
         rect = self.display.get_grid_rect(position.x, position.y)
         
         # Apply movement wave effect
         if self.wave_effect:
-            rect.y += self._calculate_wave_offset(0, self.movement_timer)
+            if wave_offset is None:
+                wave_offset = self._calculate_wave_offset(0, self.movement_timer)
+            rect.y += wave_offset
         
         # Draw shadow if enabled
         if self.shadow_effect:
@@ -227,14 +237,17 @@ class SnakeRenderer:
         tip_size = 2
         self.display.draw_circle(tongue_end, tip_size, 'red')
     
-    def _render_snake_body(self, position: Position, segment_index: int, total_segments: int) -> None:
+    def _render_snake_body(self, position: Position, segment_index: int, total_segments: int,
+                           wave_offset: Optional[float] = None) -> None:
         """Render a snake body segment."""
         colors = self.get_current_colors()
         rect = self.display.get_grid_rect(position.x, position.y)
         
         # Apply movement wave effect
         if self.wave_effect:
-            rect.y += self._calculate_wave_offset(segment_index, self.movement_timer)
+            if wave_offset is None:
+                wave_offset = self._calculate_wave_offset(segment_index, self.movement_timer)
+            rect.y += wave_offset
         
         # Check for growth animation
         growth_scale = self._get_growth_scale(position)
@@ -262,14 +275,17 @@ class SnakeRenderer:
         # Add segment-specific effects
         self._add_segment_effects(rect, segment_index, total_segments)
     
-    def _render_snake_tail(self, position: Position, segment_index: int) -> None:
+    def _render_snake_tail(self, position: Position, segment_index: int,
+                           wave_offset: Optional[float] = None) -> None:
         """Render the snake's tail with special effects."""
         colors = self.get_current_colors()
         rect = self.display.get_grid_rect(position.x, position.y)
         
         # Apply movement wave effect
         if self.wave_effect:
-            rect.y += self._calculate_wave_offset(segment_index, self.movement_timer)
+            if wave_offset is None:
+                wave_offset = self._calculate_wave_offset(segment_index, self.movement_timer)
+            rect.y += wave_offset
         
         # Check for growth animation
         growth_scale = self._get_growth_scale(position)
@@ -299,6 +315,20 @@ class SnakeRenderer:
         wave_phase = time * self.movement_speed - segment_index * 0.5
         return math.sin(wave_phase) * self.wave_amplitude
     
+    def _calculate_wave_offsets(self, count: int, time: float) -> List[float]:
+        """Calculate the wave offsets of the first `count` segments at once."""
+        if not self.wave_effect:
+            return [0.0] * count
+        
+        base_phase = time * self.movement_speed
+        amplitude = self.wave_amplitude
+        if count < WAVE_VECTORIZE_MIN_SEGMENTS:
+            # NumPy's per-call overhead outweighs the loop for short snakes
+            return [math.sin(base_phase - i * 0.5) * amplitude for i in range(count)]
+        
+        phases = base_phase - np.arange(count) * 0.5
+        return (np.sin(phases) * amplitude).tolist()
+    
     def _get_growth_scale(self, position: Position) -> float:
         """Get the growth scale for a segment at the given position."""
         for animation_data in self.growth_animations.values():
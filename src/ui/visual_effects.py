@@ -12,12 +12,17 @@ This module handles all visual effects and animations in the game:
 """
 
 import pygame
-import random
-import math
+import functools
+import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the NumPy integrator
+    njit = None
+
 
 class EffectType(Enum):
     """Types of visual effects."""
@@ -37,18 +42,47 @@ class AnimationState(Enum):
     STOPPED = "stopped"
 
 
-@dataclass
+# Compact animation state codes used by the manager's and pool's state vectors
+_ACTIVE = 0
+_PAUSED = 1
+_COMPLETED = 2
+_STOPPED = 3
+
+_STATES_BY_CODE = [AnimationState.ACTIVE, AnimationState.PAUSED,
+                   AnimationState.COMPLETED, AnimationState.STOPPED]
+
+
 class Particle:
-    """Represents a single particle in a particle system."""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: float
-    max_life: float
-    color: Tuple[int, int, int]
-    size: float
-    alpha: int = 255
+    """
+    Represents a single particle in a particle system.
+    
+    Written out by hand rather than as a dataclass so it can use __slots__
+    on every supported Python version.
+    """
+    
+    __slots__ = ('x', 'y', 'vx', 'vy', 'life', 'max_life', 'color', 'size', 'alpha')
+    
+    def __init__(self, x: float, y: float, vx: float, vy: float, life: float,
+                 max_life: float, color: Tuple[int, int, int], size: float,
+                 alpha: int = 255):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.life = life
+        self.max_life = max_life
+        self.color = color
+        self.size = size
+        self.alpha = alpha
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"Particle({fields})"
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Particle):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
     
     def update(self, dt: float) -> bool:
         """
@@ -70,14 +104,126 @@ class Particle:
             return True
         return False
     
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw the particle on the given surface."""
-        if self.alpha > 0:
-            # Create a surface with alpha for the particle
-            particle_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (*self.color, self.alpha), 
-                             (int(self.size), int(self.size)), int(self.size))
-            surface.blit(particle_surface, (int(self.x - self.size), int(self.y - self.size)))
+    def draw(self, surface: pygame.Surface,
+             sprite_atlas: Optional["SpriteAtlas"] = None) -> None:
+        """Draw the particle on the given surface using a cached sprite."""
+        level = _ALPHA_LEVEL_LUT[min(max(self.alpha, 0), 255)]
+        if level:
+            atlas = sprite_atlas if sprite_atlas is not None else _DEFAULT_SPRITE_ATLAS
+            sprite = _get_particle_sprites(atlas, self.color, self.size)[level]
+            surface.blit(sprite, (int(self.x - self.size), int(self.y - self.size)),
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def _step_kernel(px: np.ndarray, py: np.ndarray, vx: np.ndarray, vy: np.ndarray,
+                 life: np.ndarray, max_life: np.ndarray, size: np.ndarray,
+                 alpha: np.ndarray, keep: np.ndarray, draw_x: np.ndarray,
+                 draw_y: np.ndarray, effect_id: np.ndarray, effect_state: np.ndarray,
+                 alive_counts: np.ndarray, dt: float) -> None:
+    """
+    Advance a particle column set by one time step in a single pass.
+    
+    ``keep`` is both the alive predicate and the result: dead slots are
+    skipped, and particles whose life runs out are cleared from ``keep`` and
+    given zero alpha. Nothing is compacted, so slots stay where they are.
+    Particles whose owning effect (``effect_state[effect_id[i]]``) is not
+    active are left untouched. The same pass writes each live particle's
+    integer blit position into ``draw_x``/``draw_y`` so drawing never rereads
+    the float columns, and tallies surviving particles (paused ones included)
+    per owning effect into the preallocated ``alive_counts``.
+    """
+    alive_counts[:] = 0
+    for i in range(px.shape[0]):
+        if not keep[i]:
+            continue
+        if effect_state[effect_id[i]] != 0:
+            alive_counts[effect_id[i]] += 1
+            continue
+        px[i] += vx[i] * dt
+        py[i] += vy[i] * dt
+        life[i] -= dt
+        if life[i] > 0:
+            alpha[i] = int(255 * (life[i] / max_life[i]))
+            draw_x[i] = int(px[i] - size[i])
+            draw_y[i] = int(py[i] - size[i])
+            alive_counts[effect_id[i]] += 1
+        else:
+            alpha[i] = 0
+            keep[i] = False
+
+
+def _step_numpy(px: np.ndarray, py: np.ndarray, vx: np.ndarray, vy: np.ndarray,
+                life: np.ndarray, max_life: np.ndarray, size: np.ndarray,
+                alpha: np.ndarray, keep: np.ndarray, draw_x: np.ndarray,
+                draw_y: np.ndarray, effect_id: np.ndarray, effect_state: np.ndarray,
+                alive_counts: np.ndarray, dt: float) -> None:
+    """Vectorized equivalent of ``_step_kernel`` used when Numba is unavailable."""
+    moving = keep & (effect_state[effect_id] == _ACTIVE)
+    np.add(px, vx * dt, out=px, where=moving)
+    np.add(py, vy * dt, out=py, where=moving)
+    np.subtract(life, dt, out=life, where=moving)
+    dying = moving & (life <= 0)
+    keep[dying] = False
+    alpha[dying] = 0
+    moving &= keep
+    np.multiply(255, life / max_life, out=alpha, where=moving, casting='unsafe')
+    np.subtract(px, size, out=draw_x, where=moving, casting='unsafe')
+    np.subtract(py, size, out=draw_y, where=moving, casting='unsafe')
+    alive_counts[:] = 0
+    np.add.at(alive_counts, effect_id[keep], 1)
+
+
+# Physics columns are float32 and alpha is uint8 throughout so the JIT kernel
+# sees a single homogeneous signature
+PARTICLE_DTYPE = np.float32
+ALPHA_DTYPE = np.uint8
+
+if njit is not None:
+    _step = njit("void(f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], u1[:], b1[:], "
+                 "i4[:], i4[:], i4[:], u1[:], i8[:], f4)", cache=True, fastmath=True)(_step_kernel)
+else:
+    _step = _step_numpy
+
+
+# Unit-circle lookup table for spawn directions
+ANGLE_STEPS = 1024
+_ANGLES = np.linspace(0, 2 * np.pi, ANGLE_STEPS, endpoint=False)
+_COS = np.cos(_ANGLES).astype(PARTICLE_DTYPE)
+_SIN = np.sin(_ANGLES).astype(PARTICLE_DTYPE)
+
+# Particle sprites are rasterized per whole-pixel radius, capped at this bucket
+MAX_SPRITE_RADIUS = 8
+
+# Each sprite is baked at this many premultiplied alpha levels (level * 17)
+ALPHA_LEVELS = 16
+_ALPHA_LEVEL_LUT = ((np.arange(256) + 8) // 17).astype(np.uint8)
+
+SpriteAtlas = Dict[Tuple[Tuple[int, int, int], int], List[pygame.Surface]]
+
+# Atlas used by standalone particles that are not given one
+_DEFAULT_SPRITE_ATLAS: SpriteAtlas = {}
+
+
+def _get_particle_sprites(atlas: SpriteAtlas, color: Tuple[int, int, int],
+                          size: float) -> List[pygame.Surface]:
+    """
+    Get the cached alpha ramp of circle sprites for a particle colour and size.
+    
+    Sizes are quantized to whole-pixel radius buckets. On first use the circle
+    is rasterized once per alpha level and premultiplied, so particles can be
+    drawn with BLEND_PREMULTIPLIED blits and no per-blit alpha changes.
+    """
+    radius = min(max(int(size), 1), MAX_SPRITE_RADIUS)
+    key = (color, radius)
+    sprites = atlas.get(key)
+    if sprites is None:
+        sprites = []
+        for level in range(ALPHA_LEVELS):
+            sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, level * 17), (radius, radius), radius)
+            sprites.append(sprite.premul_alpha())
+        atlas[key] = sprites
+    return sprites
 
 
 @dataclass
@@ -108,87 +254,262 @@ class Animation:
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the animation. Override in subclasses."""
         pass
+    
+    def release(self) -> None:
+        """Release any pooled resources held by the animation."""
+        pass
 
 
-class ParticleSystem(Animation):
-    """Manages a collection of particles for effects like explosions."""
+class ParticlePool:
+    """
+    Fixed-capacity column storage shared by particle effects.
     
-    def __init__(self, effect_type: EffectType, position: Tuple[float, float], 
-                 particle_count: int = 20, duration: float = 1.0):
+    Slots are handed out as contiguous ranges in ring order so that an
+    effect's particles are plain array views and spawning an effect never
+    allocates new arrays. Every slot is tagged with the id of the effect that
+    owns it, which lets the whole pool be stepped and drawn in one pass.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.px = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.py = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.vx = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.vy = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.life = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.max_life = np.ones(capacity, dtype=PARTICLE_DTYPE)
+        self.size = np.zeros(capacity, dtype=PARTICLE_DTYPE)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.alpha = np.zeros(capacity, dtype=ALPHA_DTYPE)
+        self.keep = np.zeros(capacity, dtype=np.bool_)
+        self.draw_x = np.zeros(capacity, dtype=np.int32)
+        self.draw_y = np.zeros(capacity, dtype=np.int32)
+        self.effect_id = np.zeros(capacity, dtype=np.int32)
+        self.effect_state = np.zeros(capacity, dtype=np.uint8)
+        self.alive_counts = np.zeros(capacity, dtype=np.int64)
+        self.sprites: List[Optional[List[pygame.Surface]]] = [None] * capacity
+        self._free_mask = np.ones(capacity, dtype=np.bool_)
+        self._cursor = 0
+    
+    def allocate(self, count: int) -> Optional[slice]:
+        """
+        Reserve a contiguous range of free slots.
+        
+        Args:
+            count: Number of slots required
+            
+        Returns:
+            Slice covering the reserved slots, or None if no range is free
+        """
+        if count <= 0 or count > self.capacity:
+            return None
+        
+        start = self._cursor if self._cursor + count <= self.capacity else 0
+        if not self._free_mask[start:start + count].all():
+            # Fall back to the first free window at or after the cursor
+            free_runs = np.concatenate(([0], np.cumsum(self._free_mask)))
+            windows = np.flatnonzero(free_runs[count:] - free_runs[:-count] == count)
+            if len(windows) == 0:
+                return None
+            after_cursor = windows[windows >= self._cursor]
+            start = int(after_cursor[0] if len(after_cursor) else windows[0])
+        
+        self._free_mask[start:start + count] = False
+        self._cursor = (start + count) % self.capacity
+        # A range's first slot doubles as the owning effect's id
+        self.effect_id[start:start + count] = start
+        self.effect_state[start] = _ACTIVE
+        return slice(start, start + count)
+    
+    def release(self, slots: slice) -> None:
+        """Return a previously allocated range to the pool."""
+        self._free_mask[slots] = True
+        self.life[slots] = 0.0
+        self.alpha[slots] = 0
+        self.keep[slots] = False
+        self.alive_counts[slots.start] = 0
+    
+    def get_free_count(self) -> int:
+        """Get the number of unallocated slots."""
+        return int(self._free_mask.sum())
+    
+    def get_alive_count(self, slots: slice) -> int:
+        """Get how many particles in a range survived the last step."""
+        return int(self.alive_counts[slots.start])
+    
+    def step(self, dt: float) -> None:
+        """Advance every live particle in the pool with a single kernel call."""
+        _step(self.px, self.py, self.vx, self.vy, self.life, self.max_life,
+              self.size, self.alpha, self.keep, self.draw_x, self.draw_y,
+              self.effect_id, self.effect_state, self.alive_counts, dt)
+    
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw every visible particle in the pool with one batched blit."""
+        visible = np.flatnonzero(self.alpha)
+        levels = _ALPHA_LEVEL_LUT[self.alpha[visible]]
+        sprites = self.sprites
+        surface.blits(
+            [(sprites[i][level], (x, y), None, pygame.BLEND_PREMULTIPLIED)
+             for i, x, y, level in zip(visible.tolist(), self.draw_x[visible].tolist(),
+                                       self.draw_y[visible].tolist(), levels.tolist())
+             if level],
+            doreturn=False
+        )
+
+
+class PooledParticleEffect(Animation):
+    """
+    Base class for effects whose particles live in a ParticlePool.
+    
+    Effects placed in a shared pool are stepped and drawn by its owner in a
+    single pass over the pool. If no pool is given, or the shared one is
+    full, the effect gets a private pool and steps and draws itself.
+    """
+    
+    def __init__(self, effect_type: EffectType, position: Tuple[float, float],
+                 duration: float, particle_count: int,
+                 pool: Optional[ParticlePool] = None,
+                 sprite_atlas: Optional[SpriteAtlas] = None):
         super().__init__(effect_type, AnimationState.ACTIVE, duration, 0.0, position)
-        self.particles: List[Particle] = []
         self.particle_count = particle_count
+        self.sprite_atlas = sprite_atlas if sprite_atlas is not None else {}
+        
+        # Borrow a slot range from the shared pool, or own a private one
+        slots = pool.allocate(particle_count) if pool is not None else None
+        self.shared_pool = slots is not None
+        if slots is None:
+            pool = ParticlePool(max(particle_count, 1))
+            slots = pool.allocate(particle_count) or slice(0, 0)
+        self.pool = pool
+        self.slots: Optional[slice] = slots
+        self.alive_count = slots.stop - slots.start
+        
+        self.px = pool.px[slots]
+        self.py = pool.py[slots]
+        self.pvx = pool.vx[slots]
+        self.pvy = pool.vy[slots]
+        self.plife = pool.life[slots]
+        self.pmax = pool.max_life[slots]
+        self.psize = pool.size[slots]
+        self.pcolor = pool.color[slots]
+        self.palpha = pool.alpha[slots]
+        self._keep = pool.keep[slots]
+        self.draw_x = pool.draw_x[slots]
+        self.draw_y = pool.draw_y[slots]
+    
+    def _set_sprite(self, index: int, color: Tuple[int, int, int], size: float) -> None:
+        """Point a particle at its cached sprite ramp."""
+        self.pool.sprites[self.slots.start + index] = _get_particle_sprites(
+            self.sprite_atlas, color, size)
+    
+    def _step_particles(self, dt: float) -> None:
+        """Step a privately pooled effect and refresh the alive count."""
+        if not self.shared_pool:
+            self.pool.step(dt)
+        self.alive_count = self.pool.get_alive_count(self.slots)
+    
+    def get_particle_count(self) -> int:
+        """Get the number of particles still alive."""
+        return self.alive_count
+    
+    def release(self) -> None:
+        """Hand the effect's slots back to the pool."""
+        if self.slots is not None:
+            self.pool.release(self.slots)
+            self.slots = None
+            self.alive_count = 0
+    
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw the particles if no shared pool draws them."""
+        if not self.shared_pool and self.slots is not None:
+            self.pool.draw(surface)
+
+
+class ParticleSystem(PooledParticleEffect):
+    """Manages a collection of particles for effects like explosions."""
+    
+    EXPLOSION_COLORS = [
+        (255, 255, 0),   # Yellow
+        (255, 165, 0),   # Orange
+        (255, 69, 0),    # Red-orange
+        (255, 215, 0)    # Gold
+    ]
+    POWER_UP_COLORS = [
+        (0, 255, 255),   # Cyan
+        (255, 0, 255),   # Magenta
+        (255, 255, 0),   # Yellow
+        (0, 255, 0)      # Green
+    ]
+    DEFAULT_COLORS = [(255, 255, 255)]  # White
+    
+    def __init__(self, effect_type: EffectType, position: Tuple[float, float], 
+                 particle_count: int = 20, duration: float = 1.0,
+                 pool: Optional[ParticlePool] = None,
+                 sprite_atlas: Optional[SpriteAtlas] = None):
+        super().__init__(effect_type, position, duration, particle_count, pool, sprite_atlas)
+        if effect_type == EffectType.PARTICLE_EXPLOSION:
+            self.palette = self.EXPLOSION_COLORS
+        elif effect_type == EffectType.POWER_UP_ACTIVATION:
+            self.palette = self.POWER_UP_COLORS
+        else:
+            self.palette = self.DEFAULT_COLORS
         self._create_particles()
     
     def _create_particles(self) -> None:
-        """Create initial particles for the effect."""
-        for _ in range(self.particle_count):
-            # Random velocity in all directions
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(50, 150)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            # Random life span
-            life = random.uniform(0.5, 1.5)
-            
-            # Random size
-            size = random.uniform(2, 6)
-            
-            # Color based on effect type
-            if self.effect_type == EffectType.PARTICLE_EXPLOSION:
-                color = random.choice([
-                    (255, 255, 0),   # Yellow
-                    (255, 165, 0),   # Orange
-                    (255, 69, 0),    # Red-orange
-                    (255, 215, 0)    # Gold
-                ])
-            elif self.effect_type == EffectType.POWER_UP_ACTIVATION:
-                color = random.choice([
-                    (0, 255, 255),   # Cyan
-                    (255, 0, 255),   # Magenta
-                    (255, 255, 0),   # Yellow
-                    (0, 255, 0)      # Green
-                ])
-            else:
-                color = (255, 255, 255)  # White
-            
-            particle = Particle(
-                x=self.position[0],
-                y=self.position[1],
-                vx=vx,
-                vy=vy,
-                life=life,
-                max_life=life,
-                color=color,
-                size=size
-            )
-            self.particles.append(particle)
+        """Write the initial particle state into the effect's pool slots."""
+        n = self.alive_count
+        
+        # Random velocity in all directions, with angles drawn from the table
+        angle = np.random.randint(0, ANGLE_STEPS, n)
+        speed = np.random.uniform(50, 150, n)
+        np.multiply(_COS[angle], speed, out=self.pvx, casting='unsafe')
+        np.multiply(_SIN[angle], speed, out=self.pvy, casting='unsafe')
+        
+        self.px[:] = self.position[0]
+        self.py[:] = self.position[1]
+        
+        # Random life span
+        self.plife[:] = np.random.uniform(0.5, 1.5, n)
+        self.pmax[:] = self.plife
+        
+        # Random size and palette entry
+        self.psize[:] = np.random.uniform(2, 6, n)
+        self.pcolor[:] = np.random.randint(0, len(self.palette), n)
+        self.palpha[:] = 255
+        self._keep[:] = True
+        np.subtract(self.px, self.psize, out=self.draw_x, casting='unsafe')
+        np.subtract(self.py, self.psize, out=self.draw_y, casting='unsafe')
+        
+        # Colour and size are fixed for a particle's life, so resolve sprites now
+        for i, (color, size) in enumerate(zip(self.pcolor.tolist(), self.psize.tolist())):
+            self._set_sprite(i, self.palette[color], size)
     
     def update(self, dt: float) -> bool:
         """Update all particles in the system."""
         if not super().update(dt):
             return False
         
-        # Update particles
-        alive_particles = []
-        for particle in self.particles:
-            if particle.update(dt):
-                alive_particles.append(particle)
-        
-        self.particles = alive_particles
+        self._step_particles(dt)
         
         # Check if all particles are dead
-        if not self.particles:
+        if self.alive_count == 0:
             self.state = AnimationState.COMPLETED
             return False
         
         return True
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw all particles in the system."""
-        for particle in self.particles:
-            particle.draw(surface)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_font(size: int) -> pygame.font.Font:
+    """Get the default font at the given size, loading it only once."""
+    return pygame.font.Font(None, size)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_score_text(score: int, size: int,
+                       color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render and cache the "+N" text surface for a score popup."""
+    return _get_font(size).render(f"+{score}", True, color)
 
 
 class ScorePopup(Animation):
@@ -199,7 +520,8 @@ class ScorePopup(Animation):
         super().__init__(EffectType.SCORE_POPUP, AnimationState.ACTIVE, duration, 0.0, position)
         self.score = score
         self.initial_y = position[1]
-        self.font = pygame.font.Font(None, 24)
+        self.font_size = 24
+        self.font = _get_font(self.font_size)
         self.color = (255, 255, 0)  # Yellow
     
     def update(self, dt: float) -> bool:
@@ -219,8 +541,8 @@ class ScorePopup(Animation):
             # Calculate alpha based on remaining time
             alpha = int(255 * (1 - self.elapsed / self.duration))
             
-            # Create text surface with alpha
-            text_surface = self.font.render(f"+{self.score}", True, self.color)
+            # Reuse the pre-rendered text surface with this frame's alpha
+            text_surface = _render_score_text(self.score, self.font_size, self.color)
             text_surface.set_alpha(alpha)
             
             # Draw text
@@ -229,91 +551,105 @@ class ScorePopup(Animation):
 
 
 class ScreenTransition(Animation):
-    """Handles screen transitions and fades."""
+    """Handles screen transitions. Subclasses implement the drawing style."""
     
     def __init__(self, effect_type: EffectType, duration: float = 0.5):
         super().__init__(effect_type, AnimationState.ACTIVE, duration, 0.0, (0, 0))
-        self.transition_surface = None
         self.transition_type = effect_type
     
     def update(self, dt: float) -> bool:
         """Update transition animation."""
         return super().update(dt)
+
+
+class FadeTransition(ScreenTransition):
+    """Fades the screen to black and back."""
+    
+    def __init__(self, duration: float = 0.5):
+        super().__init__(EffectType.SCREEN_TRANSITION, duration)
     
     def draw(self, surface: pygame.Surface) -> None:
-        """Draw the screen transition effect."""
-        if self.transition_surface is None:
-            self.transition_surface = pygame.Surface(surface.get_size())
-            self.transition_surface.fill((0, 0, 0))
+        """Draw the fade effect."""
+        progress = self.elapsed / self.duration
+        if progress <= 0.5:
+            # Fade to black
+            alpha = int(255 * (progress * 2))
+        else:
+            # Fade from black
+            alpha = int(255 * ((1 - progress) * 2))
         
-        if self.transition_type == EffectType.SCREEN_TRANSITION:
-            # Fade effect
-            progress = self.elapsed / self.duration
-            if progress <= 0.5:
-                # Fade to black
-                alpha = int(255 * (progress * 2))
-                self.transition_surface.set_alpha(alpha)
-                surface.blit(self.transition_surface, (0, 0))
-            else:
-                # Fade from black
-                alpha = int(255 * ((1 - progress) * 2))
-                self.transition_surface.set_alpha(alpha)
-                surface.blit(self.transition_surface, (0, 0))
+        # Blending black over the frame is a per-channel scale by
+        # (255 - alpha), so darken in place instead of blitting an overlay
+        level = 255 - min(max(alpha, 0), 255)
+        surface.fill((level, level, level), special_flags=pygame.BLEND_RGB_MULT)
 
 
-class BackgroundEffect(Animation):
+class BackgroundEffect(PooledParticleEffect):
     """Creates subtle background visual effects."""
     
-    def __init__(self, effect_type: EffectType, duration: float = 2.0):
-        super().__init__(effect_type, AnimationState.ACTIVE, duration, 0.0, (0, 0))
-        self.particles: List[Particle] = []
+    PARTICLE_COUNT = 15
+    COLOR = (100, 100, 100)  # Subtle gray
+    
+    def __init__(self, effect_type: EffectType, duration: float = 2.0,
+                 bounds: Tuple[int, int] = (800, 600),
+                 pool: Optional[ParticlePool] = None,
+                 sprite_atlas: Optional[SpriteAtlas] = None):
+        super().__init__(effect_type, (0, 0), duration, self.PARTICLE_COUNT,
+                         pool, sprite_atlas)
+        self.bounds = bounds
         self._create_background_particles()
     
     def _create_background_particles(self) -> None:
-        """Create subtle background particles."""
-        for _ in range(15):
-            x = random.uniform(0, 800)  # Assuming 800x600 window
-            y = random.uniform(0, 600)
-            vx = random.uniform(-10, 10)
-            vy = random.uniform(-10, 10)
-            life = random.uniform(2.0, 4.0)
-            size = random.uniform(1, 3)
-            color = (100, 100, 100)  # Subtle gray
-            
-            particle = Particle(x, y, vx, vy, life, life, color, size)
-            self.particles.append(particle)
+        """Respawn every dead background particle slot in place."""
+        dead = ~self._keep
+        n_dead = int(dead.sum())
+        if not n_dead:
+            return
+        
+        width, height = self.bounds
+        self.px[dead] = np.random.uniform(0, width, n_dead)
+        self.py[dead] = np.random.uniform(0, height, n_dead)
+        self.pvx[dead] = np.random.uniform(-10, 10, n_dead)
+        self.pvy[dead] = np.random.uniform(-10, 10, n_dead)
+        life = np.random.uniform(2.0, 4.0, n_dead)
+        self.plife[dead] = life
+        self.pmax[dead] = life
+        self.psize[dead] = np.random.uniform(1, 3, n_dead)
+        self.palpha[dead] = 255
+        self.draw_x[dead] = self.px[dead] - self.psize[dead]
+        self.draw_y[dead] = self.py[dead] - self.psize[dead]
+        self._keep[dead] = True
+        for i in np.flatnonzero(dead).tolist():
+            self._set_sprite(i, self.COLOR, float(self.psize[i]))
     
     def update(self, dt: float) -> bool:
         """Update background particles."""
         if not super().update(dt):
             return False
         
-        # Update particles
-        alive_particles = []
-        for particle in self.particles:
-            if particle.update(dt):
-                alive_particles.append(particle)
-        
-        self.particles = alive_particles
+        self._step_particles(dt)
         
         # Replenish particles if needed
-        while len(self.particles) < 15:
-            self._create_background_particles()
+        self._create_background_particles()
         
         return True
-    
-    def draw(self, surface: pygame.Surface) -> None:
-        """Draw background particles."""
-        for particle in self.particles:
-            particle.draw(surface)
 
 
 class VisualEffectsManager:
     """Manages all visual effects and animations in the game."""
     
+    PARTICLE_POOL_SIZE = 1024
+    EFFECT_CAPACITY = 64
+    
     def __init__(self):
         """Initialize the visual effects manager."""
         self.active_effects: List[Animation] = []
+        # State code per entry of active_effects; only the first
+        # len(active_effects) codes are live, the rest is spare capacity
+        self._states = np.zeros(self.EFFECT_CAPACITY, dtype=np.uint8)
+        self.particle_pool = ParticlePool(self.PARTICLE_POOL_SIZE)
+        self._sprite_atlas: SpriteAtlas = {}
+        self.surface_size: Tuple[int, int] = (800, 600)
         self.effect_templates: Dict[EffectType, Dict[str, Any]] = {
             EffectType.PARTICLE_EXPLOSION: {
                 'particle_count': 25,
@@ -331,15 +667,27 @@ class VisualEffectsManager:
             }
         }
     
+    def _add_effect(self, effect: Animation) -> None:
+        """Start tracking a newly created effect."""
+        count = len(self.active_effects)
+        if count == len(self._states):
+            # Out of spare capacity: double it, so growth is rare and amortized
+            self._states = np.concatenate((self._states, np.zeros_like(self._states)))
+        self._states[count] = _ACTIVE
+        effect.state = AnimationState.ACTIVE
+        self.active_effects.append(effect)
+    
     def create_food_collection_effect(self, position: Tuple[float, float]) -> None:
         """Create a particle explosion effect when food is collected."""
         effect = ParticleSystem(
             EffectType.PARTICLE_EXPLOSION,
             position,
             particle_count=25,
-            duration=1.2
+            duration=1.2,
+            pool=self.particle_pool,
+            sprite_atlas=self._sprite_atlas
         )
-        self.active_effects.append(effect)
+        self._add_effect(effect)
     
     def create_power_up_effect(self, position: Tuple[float, float]) -> None:
         """Create a power-up activation effect."""
@@ -347,56 +695,91 @@ class VisualEffectsManager:
             EffectType.POWER_UP_ACTIVATION,
             position,
             particle_count=30,
-            duration=1.5
+            duration=1.5,
+            pool=self.particle_pool,
+            sprite_atlas=self._sprite_atlas
         )
-        self.active_effects.append(effect)
+        self._add_effect(effect)
     
     def create_score_popup(self, position: Tuple[float, float], score: int) -> None:
         """Create a score popup animation."""
         effect = ScorePopup(position, score, duration=1.0)
-        self.active_effects.append(effect)
+        self._add_effect(effect)
     
     def create_screen_transition(self, effect_type: EffectType = EffectType.SCREEN_TRANSITION) -> None:
         """Create a screen transition effect."""
-        effect = ScreenTransition(effect_type, duration=0.5)
-        self.active_effects.append(effect)
+        if effect_type == EffectType.SCREEN_TRANSITION:
+            effect = FadeTransition(duration=0.5)
+        else:
+            effect = ScreenTransition(effect_type, duration=0.5)
+        self._add_effect(effect)
     
     def create_background_effect(self) -> None:
         """Create a subtle background effect."""
-        effect = BackgroundEffect(EffectType.BACKGROUND_EFFECT, duration=2.0)
-        self.active_effects.append(effect)
+        effect = BackgroundEffect(
+            EffectType.BACKGROUND_EFFECT,
+            duration=2.0,
+            bounds=self.surface_size,
+            pool=self.particle_pool,
+            sprite_atlas=self._sprite_atlas
+        )
+        self._add_effect(effect)
     
     def update(self, dt: float) -> None:
         """Update all active effects."""
-        # Update effects
-        active_effects = []
-        for effect in self.active_effects:
-            if effect.update(dt):
-                active_effects.append(effect)
+        # Step every pooled particle at once, then let effects do bookkeeping
+        self.particle_pool.step(dt)
         
-        self.active_effects = active_effects
+        # Update effects; paused ones are carried over untouched. Survivors
+        # are compacted in place so creation (and draw) order is kept
+        effects = self.active_effects
+        states = self._states
+        write = 0
+        for effect, state in zip(effects, states[:len(effects)].tolist()):
+            if state != _ACTIVE or effect.update(dt):
+                effects[write] = effect
+                states[write] = state
+                write += 1
+            else:
+                effect.release()
+        del effects[write:]
     
     def draw(self, surface: pygame.Surface) -> None:
         """Draw all active effects."""
+        self.surface_size = surface.get_size()
+        self.particle_pool.draw(surface)
         for effect in self.active_effects:
             effect.draw(surface)
     
     def clear_all_effects(self) -> None:
         """Clear all active effects."""
+        for effect in self.active_effects:
+            effect.release()
         self.active_effects.clear()
     
     def get_active_effect_count(self) -> int:
         """Get the number of currently active effects."""
         return len(self.active_effects)
     
+    def get_effect_states(self) -> List[AnimationState]:
+        """Get the state of each active effect, in creation order."""
+        return [_STATES_BY_CODE[code]
+                for code in self._states[:len(self.active_effects)].tolist()]
+    
     def pause_effects(self) -> None:
         """Pause all active effects."""
-        for effect in self.active_effects:
-            if effect.state == AnimationState.ACTIVE:
-                effect.state = AnimationState.PAUSED
+        self._swap_states(_ACTIVE, _PAUSED)
     
     def resume_effects(self) -> None:
         """Resume all paused effects."""
-        for effect in self.active_effects:
-            if effect.state == AnimationState.PAUSED:
-                effect.state = AnimationState.ACTIVE
+        self._swap_states(_PAUSED, _ACTIVE)
+    
+    def _swap_states(self, old: int, new: int) -> None:
+        """Move effects and pooled particles from one state to another."""
+        states = self._states[:len(self.active_effects)]
+        for vector in (states, self.particle_pool.effect_state):
+            np.putmask(vector, vector == old, new)
+        
+        # Mirror the codes onto each effect so Animation.state never disagrees
+        for effect, code in zip(self.active_effects, states.tolist()):
+            effect.state = _STATES_BY_CODE[code]
@@ -0,0 +1,70 @@
+"""
+Performance benchmarks for the per-frame game paths.
+
+Covers the snake update, input handling and HUD drawing that run every
+frame. Requires the pytest-benchmark plugin; the whole module is skipped
+without it.
+
+Run only the benchmarks with:
+    pytest tests/test_benchmarks.py --benchmark-only --benchmark-disable-gc --benchmark-warmup=on
+
+Save a baseline with --benchmark-autosave, then gate later runs with
+--benchmark-compare --benchmark-compare-fail=mean:10%.
+"""
+
+import pytest
+import pygame
+
+pytest.importorskip("pytest_benchmark")
+
+from src.game.snake import Snake
+from src.game.grid import Position, Grid
+from src.ui.input_manager import InputManager
+from src.ui.display import DisplayManager
+from src.ui.game_renderer import GameRenderer
+from src.game.game_state import GameConfig
+
+_KEYDOWN_UP = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP)
+_KEYUP_UP = pygame.event.Event(pygame.KEYUP, key=pygame.K_UP)
+
+
+@pytest.fixture
+def game_renderer(pygame_session):
+    """A GameRenderer on a real (headless) display, so text goes through real fonts."""
+    return GameRenderer(DisplayManager(GameConfig()))
+
+
+class TestBenchmarks:
+    """Benchmark the hot Snake and InputManager paths."""
+    
+    def test_bench_snake_move(self, benchmark):
+        """Benchmark one snake step; wrap-around keeps it moving indefinitely."""
+        grid = Grid(20, 15)
+        snake = Snake(Position(10, 7))
+        
+        result = benchmark(snake.move, grid, True)
+        assert result is True
+    
+    def test_bench_handle_event(self, benchmark):
+        """Benchmark a key press, release and buffered-input read."""
+        input_manager = InputManager()
+        
+        def press_and_release():
+            input_manager.handle_event(_KEYDOWN_UP)
+            input_manager.handle_event(_KEYUP_UP)
+            return input_manager.get_buffered_input()
+        
+        result = benchmark(press_and_release)
+        assert result is not None
+    
+    def test_bench_render_hud(self, benchmark, game_renderer):
+        """Benchmark one HUD frame; unchanged values should hit the text cache."""
+        game_renderer.display._text_cache.clear()
+        benchmark(game_renderer._render_hud, 150, 3, 8, 45.5, 300)
+        
+        # Everything but the FPS readout is the same every round
+        assert len(game_renderer.display._text_cache) < 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
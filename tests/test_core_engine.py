@@ -96,7 +96,7 @@ class TestSnake:
         snake = Snake(Position(5, 5))
         
         # Mark initial positions as occupied
-        for segment in snake.get_body():
+        for segment in snake.body:
             grid.occupy_position(segment)
         
         # Test movement
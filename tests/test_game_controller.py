@@ -0,0 +1,151 @@
+"""
+Unit tests for the Game Controller.
+
+Tests how the game controller connects input handling to game logic.
+"""
+
+import pytest
+
+from src.ui.input_manager import InputManager, InputAction, ControlScheme
+from src.ui.game_controller import GameController
+from src.game.game_logic import GameLogic, GameConfig
+from src.game.grid import Direction
+
+
+class TestGameController:
+    """Test the GameController class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = GameConfig()
+        self.game_logic = GameLogic(self.config)
+        self.input_manager = InputManager()
+        self.game_controller = GameController(self.game_logic, self.input_manager)
+    
+    def test_game_controller_creation(self):
+        """Test GameController creation and initialization."""
+        assert self.game_controller is not None
+        assert self.game_controller.game_logic == self.game_logic
+        assert self.game_controller.input_manager == self.input_manager
+        assert not self.game_controller.game_running
+        assert self.game_controller.input_processing_enabled
+    
+    def test_start_game(self):
+        """Test starting the game."""
+        self.game_controller.start_game()
+        
+        assert self.game_controller.game_running
+        assert self.input_manager.input_enabled
+        assert self.input_manager.movement_enabled
+    
+    def test_stop_game(self):
+        """Test stopping the game."""
+        self.game_controller.start_game()
+        self.game_controller.stop_game()
+        
+        assert not self.game_controller.game_running
+        assert not self.input_manager.input_enabled
+        assert not self.input_manager.movement_enabled
+    
+    def test_pause_resume_game(self):
+        """Test pausing and resuming the game."""
+        self.game_controller.start_game()
+        
+        # Pause game
+        self.game_controller.pause_game()
+        assert self.game_logic.is_game_paused()
+        assert not self.input_manager.movement_enabled
+        
+        # Resume game
+        self.game_controller.resume_game()
+        assert not self.game_logic.is_game_paused()
+        assert self.input_manager.movement_enabled
+    
+    def test_restart_game(self):
+        """Test restarting the game."""
+        self.game_controller.start_game()
+        
+        # Make some changes to game state
+        self.game_logic.game_state.add_score(100)
+        
+        # Restart game
+        self.game_controller.restart_game()
+        
+        # Check game is reset
+        assert self.game_logic.get_score() == 0
+        assert self.input_manager.movement_enabled
+    
+    def test_movement_validation(self):
+        """Test movement validation logic."""
+        self.game_controller.start_game()
+        
+        # Test valid movement
+        valid = self.game_controller._is_movement_valid(Direction.UP)
+        assert valid is True
+        
+        # Test invalid movement (180° turn)
+        # First set a direction
+        self.game_logic.change_snake_direction("right")
+        
+        # Try to go left (opposite)
+        valid = self.game_controller._is_movement_valid(Direction.LEFT)
+        assert valid is False
+    
+    @pytest.mark.parametrize("action, expected", [
+        (InputAction.MOVE_UP, Direction.UP),
+        (InputAction.MOVE_DOWN, Direction.DOWN),
+        (InputAction.MOVE_LEFT, Direction.LEFT),
+        (InputAction.MOVE_RIGHT, Direction.RIGHT),
+    ])
+    def test_input_action_to_direction_conversion(self, action, expected):
+        """Test converting input actions to grid directions."""
+        assert self.game_controller._input_action_to_direction(action) == expected
+    
+    @pytest.mark.parametrize("scheme", [ControlScheme.WASD, ControlScheme.ARROW_KEYS])
+    def test_control_scheme_switching(self, scheme):
+        """Test switching control schemes."""
+        self.game_controller.set_control_scheme(scheme)
+        assert self.game_controller.get_control_scheme() == scheme
+    
+    def test_movement_delay_setting(self):
+        """Test setting movement delay."""
+        initial_delay = self.game_controller.get_movement_delay()
+        
+        # Set new delay
+        self.game_controller.set_movement_delay(0.2)
+        assert self.game_controller.get_movement_delay() == 0.2
+        
+        # Test minimum delay
+        self.game_controller.set_movement_delay(0.01)
+        assert self.game_controller.get_movement_delay() >= 0.05
+    
+    def test_input_processing_enabling_disabling(self):
+        """Test enabling and disabling input processing."""
+        # Disable input processing
+        self.game_controller.disable_input_processing()
+        assert not self.game_controller.is_input_processing_enabled()
+        
+        # Re-enable
+        self.game_controller.enable_input_processing()
+        assert self.game_controller.is_input_processing_enabled()
+    
+    def test_game_stats_retrieval(self):
+        """Test retrieving game statistics."""
+        stats = self.game_controller.get_game_stats()
+        assert stats is not None
+        
+        input_stats = self.game_controller.get_input_stats()
+        assert input_stats is not None
+    
+    def test_controller_reset(self):
+        """Test resetting the controller."""
+        self.game_controller.start_game()
+        self.game_controller.reset_controller()
+        
+        assert not self.game_controller.game_running
+        assert self.game_controller.input_processing_enabled
+        assert self.game_controller.pending_movement is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
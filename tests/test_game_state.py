@@ -9,6 +9,7 @@ Tests the core game state components including:
 """
 
 import pytest
+import sys
 import time
 from src.game.game_state import GameStatus, Difficulty, GameConfig, GameState
 
@@ -33,6 +34,12 @@ class TestGameStatus:
         assert GameStatus.PAUSED in statuses
         assert GameStatus.GAME_OVER in statuses
         assert GameStatus.SETTINGS in statuses
+    
+    def test_game_status_compares_as_string(self):
+        """Test that status members compare equal to their string values."""
+        assert GameStatus.GAME_OVER == "game_over"
+        assert GameStatus.PLAYING != "paused"
+        assert isinstance(GameStatus.MENU, str)
 
 
 class TestDifficulty:
@@ -95,6 +102,23 @@ class TestGameConfig:
         
         assert config.grid_width == 50
         assert config.initial_speed == 20.0
+    
+    def test_game_config_identity_equality(self):
+        """Test that GameConfig compares by identity, as a mutable settings object."""
+        config = GameConfig()
+        
+        assert config == config
+        assert config != GameConfig()
+        assert config in {config}  # Hashable, unlike an eq=True mutable dataclass
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_game_config_uses_slots(self):
+        """Test that GameConfig instances have no per-instance __dict__."""
+        config = GameConfig()
+        
+        assert not hasattr(config, '__dict__')
+        with pytest.raises(AttributeError):
+            config.unknown_setting = 1
 
 
 class TestGameState:
@@ -289,6 +313,12 @@ class TestGameState:
         # Speed should be capped at max_speed
         assert self.game_state.get_current_speed() == 25.0  # max_speed
     
+    def test_game_state_uses_slots(self):
+        """Test that GameState rejects attributes outside its slots."""
+        assert not hasattr(self.game_state, '__dict__')
+        with pytest.raises(AttributeError):
+            self.game_state.unknown_field = 1
+    
     def test_is_game_active(self):
         """Test checking if game is active."""
         # Initially not active (menu)
@@ -11,6 +11,12 @@ import pytest
 from src.game.grid import Position, Direction, Grid
 
 
+@pytest.fixture(scope="module")
+def shared_grid():
+    """Empty 10x8 grid shared by read-only tests."""
+    return Grid(10, 8)
+
+
 class TestPosition:
     """Test the Position dataclass."""
     
@@ -48,6 +54,17 @@ class TestPosition:
         assert repr(pos) == "Position(x=5, y=10)"
         assert str(pos) == "Position(x=5, y=10)"
     
+    def test_position_is_immutable(self):
+        """Test that Position fields cannot be reassigned."""
+        import copy
+        pos = Position(5, 10)
+        
+        with pytest.raises(AttributeError):
+            pos.x = 6
+        assert not hasattr(pos, '__dict__')
+        assert copy.copy(pos) == pos
+        assert copy.deepcopy(pos) == pos
+    
     def test_position_arithmetic(self):
         """Test Position arithmetic operations."""
         pos1 = Position(3, 4)
@@ -177,6 +194,17 @@ class TestGrid:
         # Try to free again
         assert not self.grid.free_position(pos)
     
+    def test_grid_out_of_bounds_occupancy(self):
+        """Test that positions off the grid are never tracked as occupied."""
+        for pos in (Position(-1, 0), Position(10, 0), Position(0, -1), Position(0, 8)):
+            assert not self.grid.occupy_position(pos)
+            assert not self.grid.is_position_occupied(pos)
+            assert not self.grid.free_position(pos)
+        
+        # Negative coordinates must not alias cells on the other side
+        assert not self.grid.is_position_occupied(Position(9, 0))
+        assert self.grid.get_occupied_count() == 0
+    
     def test_grid_wrapping(self):
         """Test position wrapping around grid boundaries."""
         # Test wrapping functionality
@@ -188,6 +216,10 @@ class TestGrid:
         
         wrapped = self.grid.wrap_position(Position(0, 0))
         assert wrapped == Position(0, 0)  # No wrapping needed
+        
+        # In-bounds positions are returned as-is
+        inside = Position(9, 7)
+        assert self.grid.wrap_position(inside) is inside
     
     def test_grid_get_random_free_position(self):
         """Test getting random free positions."""
@@ -213,84 +245,53 @@ class TestGrid:
         assert pos is not None
         assert self.grid.is_valid_position(pos)
     
-    def test_grid_get_neighbors(self):
-        """Test getting neighboring positions."""
-        center = Position(5, 4)
-        neighbors = self.grid.get_neighbors(center)
-        
-        # Should have 4 neighbors (up, down, left, right)
-        assert len(neighbors) == 4
-        
-        # Check specific neighbors
-        expected_neighbors = [
-            Position(5, 3),  # up
-            Position(5, 5),  # down
-            Position(4, 4),  # left
-            Position(6, 4),  # right
-        ]
-        
-        for expected in expected_neighbors:
-            assert expected in neighbors
-    
-    def test_grid_get_neighbors_with_diagonals(self):
-        """Test getting neighbors including diagonal positions."""
-        center = Position(5, 4)
-        neighbors = self.grid.get_neighbors(center, include_diagonals=True)
-        
-        # Should have 8 neighbors (4 adjacent + 4 diagonal)
-        assert len(neighbors) == 8
-        
-        # Check adjacent neighbors
-        adjacent = [
-            Position(5, 3),  # up
-            Position(5, 5),  # down
-            Position(4, 4),  # left
-            Position(6, 4),  # right
-        ]
-        
-        # Check diagonal neighbors
-        diagonal = [
-            Position(4, 3),  # up-left
-            Position(6, 3),  # up-right
-            Position(4, 5),  # down-left
-            Position(6, 5),  # down-right
-        ]
-        
-        for pos in adjacent + diagonal:
-            assert pos in neighbors
-    
-    def test_grid_get_neighbors_at_edge(self):
-        """Test getting neighbors at grid edge."""
-        center = Position(0, 0)  # Top-left corner
-        neighbors = self.grid.get_neighbors(center)
-        
-        # Should have only 2 neighbors (down and right)
-        assert len(neighbors) == 2
+    def test_grid_random_free_position_nearly_full(self):
+        """Test that the last free cell is found once the grid is nearly full."""
+        last_free = Position(3, 6)
+        for x in range(self.grid.width):
+            for y in range(self.grid.height):
+                if Position(x, y) != last_free:
+                    self.grid.occupy_position(Position(x, y))
         
-        expected_neighbors = [
-            Position(0, 1),  # down
-            Position(1, 0),  # right
-        ]
+        for _ in range(10):
+            assert self.grid.get_random_free_position() == last_free
         
-        for expected in expected_neighbors:
-            assert expected in neighbors
+        # Freeing a cell makes it eligible again
+        self.grid.free_position(Position(0, 0))
+        drawn = {self.grid.get_random_free_position() for _ in range(50)}
+        assert drawn <= {last_free, Position(0, 0)}
     
-    def test_grid_get_neighbors_with_diagonals_at_edge(self):
-        """Test getting diagonal neighbors at grid edge."""
-        center = Position(0, 0)  # Top-left corner
-        neighbors = self.grid.get_neighbors(center, include_diagonals=True)
-        
-        # Should have only 3 neighbors (down, right, down-right)
-        assert len(neighbors) == 3
-        
-        expected_neighbors = [
-            Position(0, 1),  # down
-            Position(1, 0),  # right
-            Position(1, 1),  # down-right
-        ]
-        
-        for expected in expected_neighbors:
-            assert expected in neighbors
+    def test_grid_seeded_random_free_position(self):
+        """Test that grids built with the same seed pick the same free cells."""
+        grid_a = Grid(10, 8, seed=42)
+        grid_b = Grid(10, 8, seed=42)
+        
+        picks_a = [grid_a.get_random_free_position() for _ in range(20)]
+        picks_b = [grid_b.get_random_free_position() for _ in range(20)]
+        assert picks_a == picks_b
+    
+    @pytest.mark.parametrize("center, include_diagonals, expected", [
+        # Interior cell: up, down, left, right
+        (Position(5, 4), False,
+         [Position(5, 3), Position(5, 5), Position(4, 4), Position(6, 4)]),
+        # Interior cell with diagonals: 4 adjacent + 4 diagonal
+        (Position(5, 4), True,
+         [Position(5, 3), Position(5, 5), Position(4, 4), Position(6, 4),
+          Position(4, 3), Position(6, 3), Position(4, 5), Position(6, 5)]),
+        # Top-left corner: only down and right
+        (Position(0, 0), False,
+         [Position(0, 1), Position(1, 0)]),
+        # Top-left corner with diagonals: down, right, down-right
+        (Position(0, 0), True,
+         [Position(0, 1), Position(1, 0), Position(1, 1)]),
+    ], ids=["center", "center-diagonals", "edge", "edge-diagonals"])
+    def test_grid_get_neighbors(self, shared_grid, center, include_diagonals, expected):
+        """Test getting neighboring positions, with and without diagonals."""
+        neighbors = shared_grid.get_neighbors(center, include_diagonals=include_diagonals)
+        
+        assert len(neighbors) == len(expected)
+        for pos in expected:
+            assert pos in neighbors
     
     def test_grid_center(self):
         """Test getting grid center position."""
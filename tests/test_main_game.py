@@ -0,0 +1,141 @@
+"""
+Unit tests for the main game application.
+
+Tests SnakeGame creation, component wiring and control methods.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.ui.input_manager import ControlScheme
+from src.ui.menu_manager import MenuState
+from src.game.game_logic import GameConfig
+from src.game.game_state import GameStatus
+from main import SnakeGame
+
+
+class TestMainGame:
+    """Test the main SnakeGame class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.config = GameConfig(
+            grid_width=20,
+            grid_height=15,
+            cell_size=20,
+            initial_speed=10.0,
+            speed_increase=0.5,
+            max_speed=25.0
+        )
+    
+    def test_snake_game_creation(self):
+        """Test SnakeGame creation."""
+        game = SnakeGame(self.config)
+        
+        assert game is not None
+        assert game.config == self.config
+        assert not game.running
+        assert not game.paused
+        assert game.current_screen == "game"
+    
+    def test_snake_game_components(self):
+        """Test that all game components are properly initialized."""
+        game = SnakeGame(self.config)
+        
+        # Check components exist
+        assert game.display_manager is not None
+        assert game.game_logic is not None
+        assert game.input_manager is not None
+        assert game.game_controller is not None
+        assert game.game_renderer is not None
+        assert game.game_loop is not None
+    
+    def test_snake_game_control_methods(self):
+        """Test game control methods."""
+        game = SnakeGame(self.config)
+        
+        # Test pause/resume
+        game.pause()
+        assert game.paused
+        
+        game.resume()
+        assert not game.paused
+        
+        # Test restart
+        game.restart()
+        assert game.current_screen == "game"
+        
+        # Test control scheme
+        game.set_control_scheme(ControlScheme.WASD)
+        assert game.get_control_scheme() == ControlScheme.WASD
+    
+    def test_snake_game_state_methods(self):
+        """Test game state query methods."""
+        game = SnakeGame(self.config)
+        
+        # Test initial state
+        assert not game.is_running()
+        assert not game.is_paused()
+        
+        # Test stats methods
+        game_stats = game.get_game_stats()
+        assert game_stats is not None
+        
+        input_stats = game.get_input_stats()
+        assert input_stats is not None
+
+    
+    def test_update_switches_to_pause_screen_when_paused(self):
+        """Test a paused game status routes through pause() so the flag follows the screen."""
+        game = SnakeGame(self.config)
+        game.running = True
+        
+        with patch.object(game.game_controller, 'get_game_status',
+                          return_value=GameStatus.PAUSED):
+            game.update(0.0)
+        
+        assert game.current_screen == "pause"
+        assert game.is_paused()
+        assert game.menu_manager.current_state == MenuState.PAUSE_MENU
+    
+    def test_update_switches_to_game_over_screen(self):
+        """Test a game-over status shows the game over screen and saves the score."""
+        game = SnakeGame(self.config)
+        game.running = True
+        scoring = game.game_logic.get_scoring_system()
+        
+        with patch.object(game.game_controller, 'get_game_status',
+                          return_value=GameStatus.GAME_OVER), \
+             patch.object(scoring, 'save_high_score') as mock_save:
+            game.update(0.0)
+        
+        mock_save.assert_called_once()
+        assert game.current_screen == "game_over"
+        assert not game.is_paused()
+        assert game.menu_manager.current_state == MenuState.GAME_OVER
+
+    
+    @pytest.mark.parametrize("resume", [
+        lambda game: game._handle_resume(),
+        lambda game: game._handle_menu(None, None),
+    ], ids=["resume_action", "menu_key"])
+    def test_pause_resume_round_trip(self, resume):
+        """Test pausing in play and resuming leaves the game playing, not stuck paused."""
+        game = SnakeGame(self.config)
+        game.running = True
+        game.game_controller.start_game()
+        
+        game.game_controller.pause_game()
+        game.update(0.0)
+        assert game.is_paused()
+        assert game.current_screen == "pause"
+        
+        resume(game)
+        
+        assert not game.is_paused()
+        assert game.current_screen == "game"
+        assert game.game_controller.get_game_status() is GameStatus.PLAYING
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -15,6 +15,25 @@ from src.game.snake import Snake
 from src.game.grid import Position, Direction, Grid
 
 
+# Expected bodies as (head, ..., tail), built once
+_EXPECTED_DEFAULT_BODY = tuple(Position(10 - i, 7) for i in range(3))
+_EXPECTED_CUSTOM_POSITION_BODY = tuple(Position(5 - i, 5) for i in range(3))
+_EXPECTED_LENGTH5_BODY = tuple(Position(10 - i, 7) for i in range(5))
+
+
+@pytest.fixture(scope="module")
+def snake_ro():
+    """Snake shared by tests that only read its state; never move or mutate it."""
+    return Snake(Position(10, 7))
+
+
+def _place_head_at(snake, x, y, direction=Direction.RIGHT):
+    """Lay the snake out in a horizontal line with its head at (x, y)."""
+    snake.body = [Position(x - i, y) for i in range(len(snake.body))]
+    snake.direction = direction
+    snake.next_direction = direction
+
+
 class TestSnake:
     """Test the Snake class."""
     
@@ -31,26 +50,14 @@ class TestSnake:
         assert not self.snake.growing
         
         # Check initial body positions (should be in a line to the left)
-        expected_body = [
-            Position(10, 7),  # Head
-            Position(9, 7),   # Body
-            Position(8, 7),   # Tail
-        ]
-        
-        assert self.snake.body == expected_body
+        assert tuple(self.snake.body) == _EXPECTED_DEFAULT_BODY
     
     def test_snake_initialization_with_custom_position(self):
         """Test Snake initialization with custom starting position."""
         start_pos = Position(5, 5)
         snake = Snake(start_pos)
         
-        expected_body = [
-            Position(5, 5),  # Head
-            Position(4, 5),  # Body
-            Position(3, 5),  # Tail
-        ]
-        
-        assert snake.body == expected_body
+        assert tuple(snake.body) == _EXPECTED_CUSTOM_POSITION_BODY
         assert snake.direction == Direction.RIGHT
     
     def test_snake_initialization_with_custom_length(self):
@@ -61,33 +68,25 @@ class TestSnake:
         assert not snake.growing
         
         # Check that all body segments are in a line
-        expected_body = [
-            Position(10, 7),  # Head
-            Position(9, 7),   # Body
-            Position(8, 7),   # Body
-            Position(7, 7),   # Body
-            Position(6, 7),   # Tail
-        ]
-        
-        assert snake.body == expected_body
+        assert tuple(snake.body) == _EXPECTED_LENGTH5_BODY
     
-    def test_snake_get_head(self):
+    def test_snake_get_head(self, snake_ro):
         """Test getting the snake's head position."""
-        head = self.snake.get_head()
-        assert head == self.snake.body[0]
+        head = snake_ro.get_head()
+        assert head == snake_ro.body[0]
         assert head == Position(10, 7)
     
-    def test_snake_get_tail(self):
+    def test_snake_get_tail(self, snake_ro):
         """Test getting the snake's tail position."""
-        tail = self.snake.get_tail()
-        assert tail == self.snake.body[-1]
+        tail = snake_ro.get_tail()
+        assert tail == snake_ro.body[-1]
         assert tail == Position(8, 7)
     
-    def test_snake_get_body(self):
+    def test_snake_get_body(self, snake_ro):
         """Test getting a copy of the snake's body."""
-        body_copy = self.snake.get_body()
-        assert body_copy == self.snake.body
-        assert body_copy is not self.snake.body  # Should be a copy
+        body_copy = snake_ro.get_body()
+        assert body_copy == snake_ro.body
+        assert body_copy is not snake_ro.body  # Should be a copy
     
     def test_snake_change_direction(self):
         """Test changing snake direction."""
@@ -133,8 +132,7 @@ class TestSnake:
     
     def test_snake_move(self):
         """Test basic snake movement."""
-        initial_head = self.snake.get_head()
-        initial_body = self.snake.body.copy()
+        initial_head, initial_second = self.snake.body[0], self.snake.body[1]
         
         # Move snake
         result = self.snake.move(self.grid)
@@ -148,8 +146,8 @@ class TestSnake:
         assert new_head == expected_head
         
         # Body should follow (each segment moves to previous segment's position)
-        assert self.snake.body[1] == initial_body[0]  # Body follows head
-        assert self.snake.body[2] == initial_body[1]  # Tail follows body
+        assert self.snake.body[1] == initial_head    # Body follows head
+        assert self.snake.body[2] == initial_second  # Tail follows body
     
     def test_snake_move_in_different_direction(self):
         """Test snake movement in different directions."""
@@ -190,9 +188,8 @@ class TestSnake:
     
     def test_snake_move_with_wrap_around(self):
         """Test snake movement with wrap around."""
-        # Move snake to edge
-        while self.snake.get_head().x < self.grid.width - 1:
-            self.snake.move(self.grid)
+        # Place snake at the right edge
+        _place_head_at(self.snake, self.grid.width - 1, 7)
         
         # Now at right edge, next move should wrap around
         result = self.snake.move(self.grid, wrap_around=True)
@@ -204,27 +201,26 @@ class TestSnake:
     
     def test_snake_move_without_wrap_around(self):
         """Test snake movement without wrap around."""
-        # Move snake to edge
-        while self.snake.get_head().x < self.grid.width - 1:
-            self.snake.move(self.grid)
+        # Place snake at the right edge
+        _place_head_at(self.snake, self.grid.width - 1, 7)
         
         # Now at right edge, next move should fail without wrap around
         result = self.snake.move(self.grid, wrap_around=False)
         assert result is False
     
-    def test_snake_check_collision_with_position(self):
+    def test_snake_check_collision_with_position(self, snake_ro):
         """Test collision detection with specific position."""
         # Check collision with head
-        head = self.snake.get_head()
-        assert self.snake.check_collision_with_position(head) is True
+        head = snake_ro.get_head()
+        assert snake_ro.check_collision_with_position(head) is True
         
         # Check collision with body
-        body = self.snake.body[1]
-        assert self.snake.check_collision_with_position(body) is True
+        body = snake_ro.body[1]
+        assert snake_ro.check_collision_with_position(body) is True
         
         # Check collision with empty position
         empty_pos = Position(0, 0)
-        assert self.snake.check_collision_with_position(empty_pos) is False
+        assert snake_ro.check_collision_with_position(empty_pos) is False
     
     def test_snake_check_collision_with_other_snake(self):
         """Test collision detection with another snake."""
@@ -255,41 +251,21 @@ class TestSnake:
         assert not self.snake.growing
         
         # Check body positions are reset
-        expected_body = [
-            Position(10, 7),  # Head
-            Position(9, 7),   # Body
-            Position(8, 7),   # Tail
-        ]
-        
-        assert self.snake.body == expected_body
+        assert tuple(self.snake.body) == _EXPECTED_DEFAULT_BODY
     
     def test_snake_reset_with_custom_position(self):
         """Test resetting snake with custom position."""
         custom_pos = Position(5, 5)
         self.snake.reset(custom_pos)
         
-        expected_body = [
-            Position(5, 5),  # Head
-            Position(4, 5),  # Body
-            Position(3, 5),  # Tail
-        ]
-        
-        assert self.snake.body == expected_body
+        assert tuple(self.snake.body) == _EXPECTED_CUSTOM_POSITION_BODY
     
     def test_snake_reset_with_custom_length(self):
         """Test resetting snake with custom length."""
         self.snake.reset(self.start_position, initial_length=5)
         
         assert len(self.snake.body) == 5
-        expected_body = [
-            Position(10, 7),  # Head
-            Position(9, 7),   # Body
-            Position(8, 7),   # Body
-            Position(7, 7),   # Body
-            Position(6, 7),   # Tail
-        ]
-        
-        assert self.snake.body == expected_body
+        assert tuple(self.snake.body) == _EXPECTED_LENGTH5_BODY
     
     def test_snake_get_length(self):
         """Test getting snake length."""
@@ -300,9 +276,9 @@ class TestSnake:
         self.snake.move(self.grid)
         assert self.snake.get_length() == 4
     
-    def test_snake_direction_vector(self):
+    def test_snake_direction_vector(self, snake_ro):
         """Test getting direction vector."""
-        vector = self.snake.get_direction_vector()
+        vector = snake_ro.get_direction_vector()
         assert vector == Direction.RIGHT.value
         assert vector == Position(1, 0)
     
@@ -319,20 +295,20 @@ class TestSnake:
         assert self.snake.is_moving_horizontally() is False
         assert self.snake.is_moving_vertically() is True
     
-    def test_snake_can_move_in_direction(self):
+    def test_snake_can_move_in_direction(self, snake_ro):
         """Test checking if snake can move in specific direction."""
         # Can move in perpendicular directions
-        assert self.snake.can_move_in_direction(Direction.UP) is True
-        assert self.snake.can_move_in_direction(Direction.DOWN) is True
+        assert snake_ro.can_move_in_direction(Direction.UP) is True
+        assert snake_ro.can_move_in_direction(Direction.DOWN) is True
         
         # Cannot move in opposite direction
-        assert self.snake.can_move_in_direction(Direction.LEFT) is False
+        assert snake_ro.can_move_in_direction(Direction.LEFT) is False
     
-    def test_snake_get_segments_in_direction(self):
+    def test_snake_get_segments_in_direction(self, snake_ro):
         """Test getting segments in a specific direction."""
-        segments = self.snake.get_segments_in_direction(Direction.RIGHT, 2)
+        segments = snake_ro.get_segments_in_direction(Direction.RIGHT, 2)
         
-        head = self.snake.get_head()
+        head = snake_ro.get_head()
         expected_segments = [
             head + Direction.RIGHT.value,
             head + Direction.RIGHT.value + Direction.RIGHT.value
@@ -340,9 +316,9 @@ class TestSnake:
         
         assert segments == expected_segments
     
-    def test_snake_distance_to_tail(self):
+    def test_snake_distance_to_tail(self, snake_ro):
         """Test getting distance to tail."""
-        distance = self.snake.get_distance_to_tail()
+        distance = snake_ro.get_distance_to_tail()
         assert distance == 2  # Manhattan distance from head to tail
     
     def test_snake_is_fully_extended(self):
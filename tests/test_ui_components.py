@@ -8,221 +8,284 @@ Tests the user interface components including:
 - FoodRenderer
 """
 
+import copy
 import pytest
 import pygame
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from src.ui.display import DisplayManager
 from src.ui.game_renderer import GameRenderer
-from src.ui.snake_renderer import SnakeRenderer
+from src.ui.snake_renderer import SnakeRenderer, WAVE_VECTORIZE_MIN_SEGMENTS
 from src.ui.food_renderer import FoodRenderer
+from src.ui.visual_effects import (
+    Particle, ParticleSystem, ParticlePool, BackgroundEffect, FadeTransition, ScorePopup,
+    EffectType,
+    VisualEffectsManager, PARTICLE_DTYPE, ALPHA_DTYPE,
+    _step, _step_kernel, _step_numpy, _render_score_text, _get_particle_sprites
+)
 from src.game.game_state import GameConfig
 from src.game.grid import Position, Direction
 from src.game.snake import Snake
+from src.game.food import Food
+
+# Shape arguments for the draw tests, built once; draw calls never mutate them
+_TEST_RECT_SMALL = pygame.Rect(100, 100, 50, 50)
+_TEST_POS_CENTER = (150, 150)
+
+# Keys every FoodRenderer.food_effects entry must carry
+_EXPECTED_EFFECT_KEYS = frozenset({'color', 'animation', 'particles', 'glow', 'collection_effect'})
+
+
+@pytest.fixture(scope="module")
+def display_config():
+    """Configuration shared by the DisplayManager tests."""
+    return GameConfig(
+        grid_width=20,
+        grid_height=15,
+        cell_size=25
+    )
+
+
+@pytest.fixture(scope="module")
+def display_manager(display_config):
+    """One DisplayManager for the whole module; tests mock what they mutate.
+    
+    No cleanup() on teardown: that calls pygame.quit() mid-session, and the
+    conftest pygame_session fixture already quits once per (xdist) worker.
+    """
+    # Mock pygame to avoid actual display initialization. Patch the imported
+    # module directly: module-scoped setup runs outside the per-test pygame
+    # mock, when 'pygame' may be missing from sys.modules.
+    with patch.object(pygame.display, 'set_mode'), \
+         patch.object(pygame.display, 'set_caption'), \
+         patch.object(pygame.font, 'Font'), \
+         patch.object(pygame, 'init'), \
+         patch.object(pygame.time, 'Clock'):
+        manager = DisplayManager(display_config)
+    return manager
+
+
+@pytest.fixture(scope="module")
+def _snake_mock():
+    """Spec'd Snake mock built once per module."""
+    return MagicMock(spec=Snake)
+
+
+@pytest.fixture(scope="module")
+def _food_mocks():
+    """Pair of spec'd Food mocks built once per module."""
+    return MagicMock(spec=Food), MagicMock(spec=Food)
+
+
+@pytest.fixture
+def shared_snake(_snake_mock):
+    """Module-wide snake mock; calls, return values and side effects reset after each test."""
+    yield _snake_mock
+    _snake_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def shared_food_pair(_food_mocks):
+    """Module-wide food mocks: the first uncollected, the second collected."""
+    food1, food2 = _food_mocks
+    food1.is_collected.return_value = False
+    food2.is_collected.return_value = True
+    yield _food_mocks
+    for food in _food_mocks:
+        food.reset_mock(return_value=True, side_effect=True)
 
 
 class TestDisplayManager:
     """Test the DisplayManager class."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = GameConfig(
-            grid_width=20,
-            grid_height=15,
-            cell_size=25
-        )
-        # Mock pygame to avoid actual display initialization
-        with patch('pygame.display.set_mode'), \
-             patch('pygame.display.set_caption'), \
-             patch('pygame.font.Font'), \
-             patch('pygame.init'), \
-             patch('pygame.time.Clock'):
-            self.display_manager = DisplayManager(self.config)
-    
-    def teardown_method(self):
-        """Clean up after tests."""
-        if hasattr(self, 'display_manager'):
-            self.display_manager.cleanup()
-    
-    def test_display_manager_initialization(self):
+    @pytest.fixture(autouse=True)
+    def _fresh_text_cache(self, display_manager):
+        """Start every test with an empty text cache on the shared DisplayManager."""
+        display_manager._text_cache.clear()
+    
+    def test_display_manager_initialization(self, display_manager, display_config):
         """Test DisplayManager initialization."""
-        assert self.display_manager.config == self.config
-        assert self.display_manager.screen is not None
-        assert self.display_manager.font is not None
-        assert self.display_manager.clock is not None
+        assert display_manager.config == display_config
+        assert display_manager.screen is not None
+        assert display_manager.font is not None
+        assert display_manager.clock is not None
         
         # Check that colors are initialized
-        assert 'black' in self.display_manager.colors
-        assert 'white' in self.display_manager.colors
-        assert 'red' in self.display_manager.colors
-        assert 'green' in self.display_manager.colors
+        assert {'black', 'white', 'red', 'green'} <= display_manager.colors.keys()
     
-    def test_display_manager_get_screen(self):
+    def test_display_manager_get_screen(self, display_manager):
         """Test getting the screen surface."""
-        screen = self.display_manager.get_screen()
-        assert screen == self.display_manager.screen
+        screen = display_manager.get_screen()
+        assert screen == display_manager.screen
     
-    def test_display_manager_get_clock(self):
+    def test_display_manager_get_clock(self, display_manager):
         """Test getting the clock."""
-        clock = self.display_manager.get_clock()
-        assert clock == self.display_manager.clock
+        clock = display_manager.get_clock()
+        assert clock == display_manager.clock
     
-    def test_display_manager_get_colors(self):
+    def test_display_manager_get_colors(self, display_manager):
         """Test getting the color palette."""
-        colors = self.display_manager.get_colors()
+        colors = display_manager.get_colors()
         assert isinstance(colors, dict)
         assert len(colors) > 0
     
-    def test_display_manager_get_color(self):
-        """Test getting specific colors."""
-        # Test valid colors
-        assert self.display_manager.get_color('red') == (255, 0, 0)
-        assert self.display_manager.get_color('green') == (0, 255, 0)
-        assert self.display_manager.get_color('blue') == (0, 0, 255)
-        
-        # Test invalid color (should return white as fallback)
-        assert self.display_manager.get_color('invalid_color') == (255, 255, 255)
-    
-    def test_display_manager_get_window_size(self):
+    @pytest.mark.parametrize("method, args, expected", [
+        ('get_color', ('red',), (255, 0, 0)),
+        ('get_color', ('green',), (0, 255, 0)),
+        ('get_color', ('blue',), (0, 0, 255)),
+        ('get_color', ('invalid_color',), (255, 255, 255)),  # White fallback
+        ('get_grid_size', (), (20 * 25, 15 * 25)),  # grid dimensions * cell_size
+        ('get_cell_size', (), 25),
+        ('get_grid_position', (5, 3), (5 * 25, 3 * 25)),  # grid coords * cell_size
+        ('is_initialized', (), True),
+    ])
+    def test_display_manager_getters(self, display_manager, method, args, expected):
+        """Test the DisplayManager value getters."""
+        assert getattr(display_manager, method)(*args) == expected
+    
+    def test_display_manager_get_window_size(self, display_manager):
         """Test getting window dimensions."""
         # Mock screen.get_size
-        self.display_manager.screen.get_size = Mock(return_value=(500, 400))
+        display_manager.screen.get_size = Mock(return_value=(500, 400))
         
-        size = self.display_manager.get_window_size()
+        size = display_manager.get_window_size()
         assert size == (500, 400)
     
-    def test_display_manager_get_grid_size(self):
-        """Test getting grid dimensions."""
-        grid_size = self.display_manager.get_grid_size()
-        expected_width = 20 * 25  # grid_width * cell_size
-        expected_height = 15 * 25  # grid_height * cell_size
-        assert grid_size == (expected_width, expected_height)
-    
-    def test_display_manager_get_cell_size(self):
-        """Test getting cell size."""
-        cell_size = self.display_manager.get_cell_size()
-        assert cell_size == 25
-    
-    def test_display_manager_clear_screen(self):
+    def test_display_manager_clear_screen(self, display_manager):
         """Test clearing the screen."""
         # Mock the screen.fill method
-        self.display_manager.screen.fill = Mock()
+        display_manager.screen.fill = Mock()
         
-        self.display_manager.clear_screen('black')
+        display_manager.clear_screen('black')
         
         # Should call screen.fill with black color
-        self.display_manager.screen.fill.assert_called_once()
-        call_args = self.display_manager.screen.fill.call_args[0]
+        display_manager.screen.fill.assert_called_once()
+        call_args = display_manager.screen.fill.call_args[0]
         assert call_args[0] == (0, 0, 0)  # Black color
     
-    def test_display_manager_update_display(self):
+    def test_display_manager_update_display(self, display_manager):
         """Test updating the display."""
         # Mock the pygame.display.flip method
         with patch('pygame.display.flip') as mock_flip:
-            self.display_manager.update_display()
+            display_manager.update_display()
             mock_flip.assert_called_once()
     
-    def test_display_manager_set_fps(self):
+    def test_display_manager_set_fps(self, display_manager):
         """Test setting FPS."""
         # Mock clock.tick
-        self.display_manager.clock.tick = Mock()
+        display_manager.clock.tick = Mock()
         
-        self.display_manager.set_fps(60)
-        self.display_manager.clock.tick.assert_called_once_with(60)
+        display_manager.set_fps(60)
+        display_manager.clock.tick.assert_called_once_with(60)
     
-    def test_display_manager_get_fps(self):
+    def test_display_manager_get_fps(self, display_manager):
         """Test getting FPS."""
         # Mock clock.get_fps
-        self.display_manager.clock.get_fps = Mock(return_value=58.5)
+        display_manager.clock.get_fps = Mock(return_value=58.5)
         
-        fps = self.display_manager.get_fps()
+        fps = display_manager.get_fps()
         assert fps == 58.5
     
-    def test_display_manager_draw_text(self):
+    def test_display_manager_draw_text(self, display_manager):
         """Test drawing text."""
         # Mock font.render and screen.blit
         mock_text_surface = Mock()
         mock_text_surface.get_rect = Mock(return_value=Mock())
         
-        self.display_manager.font.render = Mock(return_value=mock_text_surface)
-        self.display_manager.screen.blit = Mock()
+        display_manager.font.render = Mock(return_value=mock_text_surface)
+        display_manager.screen.blit = Mock()
         
-        self.display_manager.draw_text("Test Text", (100, 100))
+        display_manager.draw_text("Test Text", (100, 100))
         
         # Should render text and blit to screen
-        assert self.display_manager.font.render.called
-        assert self.display_manager.screen.blit.called
+        assert display_manager.font.render.called
+        assert display_manager.screen.blit.called
     
-    def test_display_manager_draw_rect(self):
+    def test_display_manager_draw_rect(self, display_manager):
         """Test drawing rectangles."""
         # Mock pygame.draw.rect
         with patch('pygame.draw.rect') as mock_rect:
-            rect = pygame.Rect(100, 100, 50, 50)
-            
             # Test filled rectangle
-            self.display_manager.draw_rect(rect, 'red', fill=True)
+            display_manager.draw_rect(_TEST_RECT_SMALL, 'red', fill=True)
             mock_rect.assert_called()
             
             # Test outlined rectangle
-            self.display_manager.draw_rect(rect, 'blue', fill=False, border_width=2)
+            display_manager.draw_rect(_TEST_RECT_SMALL, 'blue', fill=False, border_width=2)
             mock_rect.assert_called()
     
-    def test_display_manager_draw_circle(self):
+    def test_display_manager_draw_circle(self, display_manager):
         """Test drawing circles."""
         # Mock pygame.draw.circle
         with patch('pygame.draw.circle') as mock_circle:
-            position = (150, 150)
-            
             # Test filled circle
-            self.display_manager.draw_circle(position, 25, 'green', fill=True)
+            display_manager.draw_circle(_TEST_POS_CENTER, 25, 'green', fill=True)
             mock_circle.assert_called()
             
             # Test outlined circle
-            self.display_manager.draw_circle(position, 30, 'yellow', fill=False, border_width=3)
+            display_manager.draw_circle(_TEST_POS_CENTER, 30, 'yellow', fill=False, border_width=3)
             mock_circle.assert_called()
     
-    def test_display_manager_get_grid_position(self):
-        """Test grid to screen coordinate conversion."""
-        screen_pos = self.display_manager.get_grid_position(5, 3)
-        expected_x = 5 * 25  # grid_x * cell_size
-        expected_y = 3 * 25  # grid_y * cell_size
-        assert screen_pos == (expected_x, expected_y)
-    
-    def test_display_manager_get_grid_rect(self):
+    def test_display_manager_get_grid_rect(self, display_manager):
         """Test getting grid rectangle."""
-        rect = self.display_manager.get_grid_rect(5, 3)
+        rect = display_manager.get_grid_rect(5, 3)
         assert rect.x == 125  # 5 * 25
         assert rect.y == 75   # 3 * 25
         assert rect.width == 25
         assert rect.height == 25
     
-    def test_display_manager_is_initialized(self):
-        """Test initialization check."""
-        # Should be initialized after setup
-        assert self.display_manager.is_initialized() is True
+    def test_draw_text_is_cached(self, display_manager):
+        """Test repeated draw_text calls reuse the rendered surface."""
+        display_manager.font.render.reset_mock()
+        
+        display_manager.draw_text("Score: 0", (10, 10))
+        display_manager.draw_text("Score: 0", (10, 10))
+        assert display_manager.font.render.call_count == 1
+        
+        # A different string or colour renders afresh
+        display_manager.draw_text("Score: 10", (10, 10))
+        display_manager.draw_text("Score: 0", (10, 10), color='red')
+        assert display_manager.font.render.call_count == 3
     
-    def test_display_manager_cleanup(self):
+    def test_display_manager_cleanup(self, display_manager):
         """Test cleanup method."""
-        # Mock pygame.quit
-        with patch('pygame.quit') as mock_quit:
-            self.display_manager.cleanup()
+        # Patch the real module display.py calls into; a 'pygame.quit' string
+        # target would hit conftest's mock and let the real quit run mid-session
+        with patch.object(pygame, 'quit') as mock_quit:
+            display_manager.cleanup()
             mock_quit.assert_called_once()
 
 
 class TestGameRenderer:
     """Test the GameRenderer class."""
     
+    @classmethod
+    def setup_class(cls):
+        """Build the display stub once; tests replace what they assert on with a Mock."""
+        def draw(*args, **kwargs):
+            return None
+        
+        cls._display_template = SimpleNamespace(
+            get_cell_size=lambda: 20,
+            get_grid_size=lambda: (400, 300),
+            get_window_size=lambda: (400, 380),
+            get_fps=lambda: 60.0,
+            get_color=lambda name: (255, 255, 255),
+            get_grid_rect=lambda x, y: pygame.Rect(x * 20, y * 20, 20, 20),
+            clear_screen=draw,
+            draw_text=draw,
+            draw_rect=draw,
+            draw_circle=draw,
+            draw_line=draw,
+            draw_polygon=draw,
+            screen=MagicMock(),
+            font=MagicMock(),
+            small_font=MagicMock(),
+            large_font=MagicMock(),
+        )
+    
     def setup_method(self):
         """Set up test fixtures."""
-        self.config = GameConfig()
-        self.display_manager = Mock()
-        self.display_manager.get_cell_size.return_value = 20
-        self.display_manager.get_grid_size.return_value = (400, 300)
-        self.display_manager.get_window_size.return_value = (400, 380)
-        self.display_manager.screen = Mock()
-        self.display_manager.font = Mock()
-        self.display_manager.small_font = Mock()
-        self.display_manager.large_font = Mock()
-        
+        self.display_manager = copy.copy(self._display_template)
         self.game_renderer = GameRenderer(self.display_manager)
     
     def test_game_renderer_initialization(self):
@@ -231,15 +294,11 @@ class TestGameRenderer:
         assert self.game_renderer.cell_size == 20
         
         # Check color configurations
-        assert 'head' in self.game_renderer.snake_colors
-        assert 'body' in self.game_renderer.snake_colors
-        assert 'tail' in self.game_renderer.snake_colors
+        assert {'head', 'body', 'tail'} <= self.game_renderer.snake_colors.keys()
     
-    def test_game_renderer_render_game(self):
+    def test_game_renderer_render_game(self, shared_snake, shared_food_pair):
         """Test rendering the main game."""
-        # Mock snake and food
-        mock_snake = Mock()
-        mock_food_list = [Mock(), Mock()]
+        mock_food_list = list(shared_food_pair)
         
         # Mock drawing methods
         self.game_renderer._render_grid = Mock()
@@ -249,7 +308,7 @@ class TestGameRenderer:
         
         # Render game
         self.game_renderer.render_game(
-            snake=mock_snake,
+            snake=shared_snake,
             food_list=mock_food_list,
             score=150,
             level=3,
@@ -260,42 +319,72 @@ class TestGameRenderer:
         
         # Check that all drawing methods were called
         self.game_renderer._render_grid.assert_called_once()
-        self.game_renderer._render_snake.assert_called_once_with(mock_snake)
+        self.game_renderer._render_snake.assert_called_once_with(shared_snake)
         self.game_renderer._render_food.assert_called_once_with(mock_food_list)
         self.game_renderer._render_hud.assert_called_once_with(150, 3, 8, 45.5, 300)
     
-    def test_game_renderer_render_grid(self):
-        """Test rendering the game grid."""
-        # Mock display.draw_line
+    def test_render_grid_blits_cached_surface(self):
+        """Test the grid is drawn once and blitted from a cached surface."""
+        self.display_manager.screen = Mock()
         self.display_manager.draw_line = Mock()
         
         self.game_renderer._render_grid()
+        grid_surface = self.game_renderer._grid_surface
+        self.game_renderer._render_grid()
+        
+        # Same surface both frames, no per-frame line drawing
+        assert grid_surface is self.game_renderer._grid_surface
+        assert grid_surface.get_size() == (401, 301)
+        assert self.display_manager.screen.blit.call_count == 2
+        self.display_manager.screen.blit.assert_called_with(grid_surface, (0, 0))
+        self.display_manager.draw_line.assert_not_called()
+    
+    def test_render_grid_uses_color_keyed_surface(self):
+        """Test the cached grid is an opaque RLE color-keyed surface, not per-pixel alpha."""
+        self.display_manager.screen = Mock()
+        self.game_renderer._render_grid()
+        grid_surface = self.game_renderer._grid_surface
+        
+        assert not grid_surface.get_flags() & pygame.SRCALPHA
+        assert grid_surface.get_flags() & pygame.RLEACCELOK
+        assert grid_surface.get_colorkey() is not None
+    
+    def test_render_grid_rebuilds_on_change(self):
+        """Test the cached grid is rebuilt when the color, grid or cell size changes."""
+        self.display_manager.screen = Mock()
+        self.game_renderer._render_grid()
+        first = self.game_renderer._grid_surface
+        
+        self.display_manager.get_color = lambda name: (10, 20, 30)
+        self.game_renderer._render_grid()
+        recolored = self.game_renderer._grid_surface
+        assert recolored is not first
+        
+        self.game_renderer.cell_size = 40
+        self.game_renderer._render_grid()
+        assert self.game_renderer._grid_surface is not recolored
         
-        # Should draw grid lines
-        assert self.display_manager.draw_line.called
+        self.display_manager.get_grid_size = lambda: (200, 100)
+        self.game_renderer._render_grid()
+        assert self.game_renderer._grid_surface.get_size() == (201, 101)
     
-    def test_game_renderer_render_snake(self):
+    def test_game_renderer_render_snake(self, shared_snake):
         """Test rendering the snake."""
-        mock_snake = Mock()
-        mock_snake.get_body.return_value = [Position(5, 5), Position(4, 5), Position(3, 5)]
+        shared_snake.get_body.return_value = [Position(5, 5), Position(4, 5), Position(3, 5)]
         
         # Mock rendering methods
         self.game_renderer._render_snake_head = Mock()
         self.game_renderer._render_snake_segment = Mock()
         
-        self.game_renderer._render_snake(mock_snake)
+        self.game_renderer._render_snake(shared_snake)
         
         # Should render head and segments
         assert self.game_renderer._render_snake_head.called
         assert self.game_renderer._render_snake_segment.called
     
-    def test_game_renderer_render_food(self):
+    def test_game_renderer_render_food(self, shared_food_pair):
         """Test rendering food items."""
-        mock_food1 = Mock()
-        mock_food1.is_collected.return_value = False
-        mock_food2 = Mock()
-        mock_food2.is_collected.return_value = True  # Collected food
-        
+        mock_food1, mock_food2 = shared_food_pair  # mock_food2 is already collected
         food_list = [mock_food1, mock_food2]
         
         # Mock rendering method
@@ -311,7 +400,7 @@ class TestGameRenderer:
         # Mock display methods
         self.display_manager.draw_rect = Mock()
         self.display_manager.draw_text = Mock()
-        self.display_manager.get_fps.return_value = 58.5
+        self.display_manager.get_fps = Mock(return_value=58.5)
         
         self.game_renderer._render_hud(150, 3, 8, 45.5, 300)
         
@@ -386,6 +475,18 @@ class TestSnakeRenderer:
             
             # Should draw snake segments
             assert mock_rect.called
+    
+    def test_wave_offsets_match_per_segment_calculation(self):
+        """Test the batched wave offsets agree with the scalar formula."""
+        timer = 1.3
+        # Both sides of the loop/NumPy threshold
+        for count in (5, WAVE_VECTORIZE_MIN_SEGMENTS + 5):
+            offsets = self.snake_renderer._calculate_wave_offsets(count, timer)
+            expected = [self.snake_renderer._calculate_wave_offset(i, timer) for i in range(count)]
+            assert offsets == pytest.approx(expected)
+        
+        self.snake_renderer.wave_effect = False
+        assert self.snake_renderer._calculate_wave_offsets(3, timer) == [0.0, 0.0, 0.0]
 
 
 class TestFoodRenderer:
@@ -404,6 +505,15 @@ class TestFoodRenderer:
         assert self.food_renderer.display == self.display_manager
         assert self.food_renderer.cell_size == 20
     
+    def test_food_effects_configuration(self):
+        """Test every configured food effect carries the full key set."""
+        missing = {
+            food_type: _EXPECTED_EFFECT_KEYS - effects.keys()
+            for food_type, effects in self.food_renderer.food_effects.items()
+            if not _EXPECTED_EFFECT_KEYS <= effects.keys()
+        }
+        assert not missing, missing
+    
     def test_food_renderer_render_food(self):
         """Test rendering food items."""
         # Create mock food objects
@@ -423,7 +533,264 @@ class TestFoodRenderer:
             
             # Should only render uncollected food
             assert mock_circle.called
+    
+    def test_render_food_filters_once(self):
+        """Test each item is checked once and collected items are never drawn."""
+        food_list = [MagicMock(spec=Food) for _ in range(100)]
+        for i, food in enumerate(food_list):
+            food.is_collected.return_value = i % 2 == 1
+        self.food_renderer._render_food_item = Mock()
+        
+        self.food_renderer.render_food(food_list)
+        
+        assert all(food.is_collected.call_count == 1 for food in food_list)
+        drawn = [call.args[0] for call in self.food_renderer._render_food_item.call_args_list]
+        assert drawn == food_list[::2]
+
+
+
+class TestParticleSystem:
+    """Test the particle system integrator."""
+    
+    def test_step_kernel_matches_numpy_fallback(self):
+        """Test that the JIT kernel, its Python source and the NumPy fallback agree."""
+        import numpy as np
+        columns = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [10.0, -10.0, 0.0],
+                   [0.0, 5.0, -5.0], [1.0, 0.01, 0.5], [1.0, 1.0, 1.0],
+                   [2.0, 2.0, 2.0]]
+        results = []
+        for step in (_step, _step_kernel, _step_numpy):
+            cols = [np.array(c, dtype=PARTICLE_DTYPE) for c in columns]
+            alpha = np.full(3, 255, dtype=ALPHA_DTYPE)
+            keep = np.ones(3, dtype=np.bool_)
+            draw_x = np.zeros(3, dtype=np.int32)
+            draw_y = np.zeros(3, dtype=np.int32)
+            effect_id = np.zeros(3, dtype=np.int32)
+            effect_state = np.zeros(3, dtype=np.uint8)
+            alive_counts = np.full(3, 7, dtype=np.int64)
+            step(*cols, alpha, keep, draw_x, draw_y, effect_id, effect_state, alive_counts, 0.1)
+            assert all(c.dtype == PARTICLE_DTYPE for c in cols)
+            assert alpha.dtype == ALPHA_DTYPE
+            assert alive_counts.tolist() == [2, 0, 0]
+            results.append((cols, alpha, keep, draw_x, draw_y))
+        
+        cols_a, alpha_a, keep_a, draw_x_a, draw_y_a = results[0]
+        assert draw_x_a[keep_a].tolist() == [0, 1]
+        assert draw_y_a[keep_a].tolist() == [2, 3]
+        for cols_b, alpha_b, keep_b, draw_x_b, draw_y_b in results[1:]:
+            for a, b in zip(cols_a, cols_b):
+                assert np.allclose(a, b)
+            assert keep_a.tolist() == keep_b.tolist() == [True, False, True]
+            assert alpha_a.tolist() == alpha_b.tolist()
+            assert draw_x_a[keep_a].tolist() == draw_x_b[keep_b].tolist()
+            assert draw_y_a[keep_a].tolist() == draw_y_b[keep_b].tolist()
+    
+    def test_particle_uses_slots(self):
+        """Test that standalone particles carry no per-instance __dict__."""
+        particle = Particle(1.0, 2.0, 3.0, 4.0, 1.0, 1.0, (255, 255, 255), 2.0)
+        assert not hasattr(particle, '__dict__')
+        assert particle.alpha == 255
+        assert particle == Particle(1.0, 2.0, 3.0, 4.0, 1.0, 1.0, (255, 255, 255), 2.0)
+        
+        assert particle.update(0.5)
+        assert particle.x == 2.5 and particle.alpha == 127
+    
+    def test_particle_draw_reuses_cached_sprite(self):
+        """Test that drawing a standalone particle allocates no new surface."""
+        particle = Particle(10.0, 10.0, 0.0, 0.0, 1.0, 1.0, (255, 255, 255), 3.0)
+        target = pygame.Surface((20, 20))
+        atlas = {}
+        particle.draw(target, atlas)
+        
+        with patch('src.ui.visual_effects.pygame.Surface') as mock_surface:
+            particle.draw(target, atlas)
+            mock_surface.assert_not_called()
+        assert target.get_at((10, 10))[:3] == (255, 255, 255)
+    
+    def test_particle_system_expires(self):
+        """Test that a particle system completes once its particles die."""
+        system = ParticleSystem(EffectType.PARTICLE_EXPLOSION, (100, 100),
+                                particle_count=10, duration=5.0)
+        assert system.get_particle_count() == 10
+        px = system.px
+        
+        assert system.update(0.1)
+        assert system.px is px
+        assert system.update(2.0) is False
+        assert system.get_particle_count() == 0
+    
+    def test_particle_spawn_speeds_from_angle_table(self):
+        """Test that table-sampled directions keep spawn speeds in range."""
+        import numpy as np
+        system = ParticleSystem(EffectType.POWER_UP_ACTIVATION, (0, 0), particle_count=200)
+        speed = np.hypot(system.pvx, system.pvy)
+        assert system.pvx.dtype == PARTICLE_DTYPE
+        assert (speed >= 49.9).all() and (speed <= 150.1).all()
+    
+    def test_particle_pool_reuses_released_slots(self):
+        """Test that released slot ranges are handed out again."""
+        pool = ParticlePool(capacity=8)
+        first = pool.allocate(5)
+        assert first == slice(0, 5)
+        assert pool.allocate(5) is None
+        
+        pool.release(first)
+        assert pool.get_free_count() == 8
+        assert pool.allocate(5) is not None
+    
+    def test_manager_returns_slots_to_pool(self):
+        """Test that finished effects give their slots back to the manager pool."""
+        manager = VisualEffectsManager()
+        pool = manager.particle_pool
+        manager.create_food_collection_effect((50, 50))
+        assert pool.get_free_count() == pool.capacity - 25
+        
+        manager.clear_all_effects()
+        assert pool.get_free_count() == pool.capacity
+    
+    def test_manager_steps_all_pooled_particles_at_once(self):
+        """Test that the manager advances every pooled effect with one pool step."""
+        manager = VisualEffectsManager()
+        manager.create_food_collection_effect((50, 50))
+        manager.create_power_up_effect((60, 60))
+        assert all(effect.shared_pool for effect in manager.active_effects)
+        
+        with patch.object(manager.particle_pool, 'step',
+                          wraps=manager.particle_pool.step) as mock_step:
+            manager.update(0.1)
+        
+        mock_step.assert_called_once_with(0.1)
+        counts = [effect.get_particle_count() for effect in manager.active_effects]
+        assert counts == [25, 30]
+        assert int(manager.particle_pool.alive_counts.sum()) == 55
+        
+        # Counts are tallied into the same preallocated buffer every frame
+        alive_counts = manager.particle_pool.alive_counts
+        manager.update(0.1)
+        assert manager.particle_pool.alive_counts is alive_counts
+    
+    def test_manager_pause_freezes_pooled_particles(self):
+        """Test that pausing stops particles and effects from advancing."""
+        from src.ui.visual_effects import AnimationState
+        manager = VisualEffectsManager()
+        manager.create_food_collection_effect((50, 50))
+        effect = manager.active_effects[0]
+        
+        manager.pause_effects()
+        assert manager.get_effect_states() == [AnimationState.PAUSED]
+        assert effect.state is AnimationState.PAUSED
+        px = effect.px.copy()
+        manager.update(0.1)
+        assert (effect.px == px).all()
+        assert effect.elapsed == 0.0
+        assert manager.particle_pool.get_alive_count(effect.slots) == 25
+        
+        manager.resume_effects()
+        assert manager.get_effect_states() == [AnimationState.ACTIVE]
+        assert effect.state is AnimationState.ACTIVE
+        manager.update(0.1)
+        assert effect.elapsed == 0.1
+        assert not (effect.px == px).all()
+    
+    def test_manager_state_vector_reused_across_spawn_and_removal(self):
+        """Test that spawning and expiring effects reuse the preallocated state vector."""
+        from src.ui.visual_effects import AnimationState
+        manager = VisualEffectsManager()
+        states = manager._states
+        
+        manager.create_screen_transition()
+        manager.create_food_collection_effect((50, 50))
+        manager.create_screen_transition()
+        manager.active_effects[0].duration = 0.05
+        manager.update(0.1)
+        
+        # The expired first effect is dropped and the survivors keep their order
+        assert manager._states is states
+        assert manager.get_active_effect_count() == 2
+        assert [type(e).__name__ for e in manager.active_effects] == ['ParticleSystem', 'FadeTransition']
+        assert manager.get_effect_states() == [AnimationState.ACTIVE, AnimationState.ACTIVE]
+    
+    def test_manager_state_vector_grows_past_capacity(self):
+        """Test that the state vector doubles once more effects are live than it holds."""
+        manager = VisualEffectsManager()
+        for _ in range(manager.EFFECT_CAPACITY + 1):
+            manager.create_screen_transition()
+        
+        assert len(manager._states) == 2 * manager.EFFECT_CAPACITY
+        assert len(manager.get_effect_states()) == manager.EFFECT_CAPACITY + 1
+    
+    def test_manager_shares_sprite_atlas_between_effects(self):
+        """Test that particle sprites are rasterized once per colour and size."""
+        manager = VisualEffectsManager()
+        manager.create_food_collection_effect((50, 50))
+        manager.create_food_collection_effect((60, 60))
+        
+        surface = pygame.Surface((100, 100))
+        manager.draw(surface)
+        atlas_size = len(manager._sprite_atlas)
+        assert 0 < atlas_size <= len(ParticleSystem.EXPLOSION_COLORS) * 8
+        
+        manager.draw(surface)
+        assert len(manager._sprite_atlas) == atlas_size
+        assert all(effect.sprite_atlas is manager._sprite_atlas
+                   for effect in manager.active_effects)
+    
+    def test_premultiplied_sprites_match_straight_alpha_blend(self):
+        """Test that premultiplied sprite blits blend like straight alpha."""
+        sprites = _get_particle_sprites({}, (255, 165, 0), 4.0)
+        assert len(sprites) == 16
+        
+        for level in (8, 15):
+            target = pygame.Surface((8, 8))
+            target.fill((100, 100, 100))
+            target.blit(sprites[level], (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+            
+            alpha = level * 17 / 255
+            expected = [round(c * alpha + 100 * (1 - alpha)) for c in (255, 165, 0)]
+            actual = target.get_at((4, 4))[:3]
+            assert all(abs(a - e) <= 2 for a, e in zip(actual, expected))
+    
+    def test_background_effect_respawns_in_place(self):
+        """Test that background particles are replenished without growing."""
+        effect = BackgroundEffect(EffectType.BACKGROUND_EFFECT, duration=10.0,
+                                  bounds=(320, 240))
+        px = effect.px
+        
+        assert effect.update(5.0)
+        assert effect.px is px
+        assert len(effect.px) == BackgroundEffect.PARTICLE_COUNT
+        assert effect._keep.all()
+        assert (effect.plife > 0).all()
+        assert (effect.px <= 320).all() and (effect.py <= 240).all()
+    
+    def test_screen_transition_matches_alpha_overlay(self):
+        """Test that the in-place fade matches blitting a black alpha overlay."""
+        transition = FadeTransition(duration=1.0)
+        transition.elapsed = 0.25
+        
+        faded = pygame.Surface((4, 4))
+        faded.fill((200, 100, 50))
+        transition.draw(faded)
+        
+        expected = pygame.Surface((4, 4))
+        expected.fill((200, 100, 50))
+        overlay = pygame.Surface((4, 4))
+        overlay.set_alpha(127)
+        expected.blit(overlay, (0, 0))
+        
+        assert faded.get_at((0, 0)) == expected.get_at((0, 0))
+    
+    def test_score_popups_reuse_font_and_text(self):
+        """Test that score popups share the loaded font and rendered text."""
+        first = ScorePopup((10, 10), 50)
+        second = ScorePopup((20, 20), 50)
+        assert first.font is second.font
+        
+        surface = pygame.Surface((100, 100))
+        first.draw(surface)
+        second.draw(surface)
+        assert _render_score_text.cache_info().hits >= 1
 
 
 if __name__ == "__main__":
-    pytest.main([__file__])
+    pytest.main([__file__, "-p", "no:cacheprovider"])